@@ -0,0 +1,220 @@
+"""Benchmark the full research agent offline, end to end and per node.
+
+Runs the ``agent`` graph from ``agents/writer/graph.py`` (scope, supervisor,
+research sub-graphs and final report) against the scripted chat model and the
+fixture search provider in ``benchmarks.fakes``, with prompts read from the
+bundled prompt files. Each scenario varies the number of researchers and the
+size of the fetched pages. No network access or API key is required.
+
+Usage:
+    python -m benchmarks.agent --researchers 1,3,5 --page-words 500,4000 \\
+        --rounds 3 --output bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class NodeTimer(BaseCallbackHandler):
+    """Collects the wall-clock duration of every graph node run"""
+
+    run_inline = True
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self._started: Dict[UUID, tuple] = {}
+
+    def on_chain_start(
+        self, serialized, inputs, *, run_id: UUID, metadata=None, **kwargs: Any
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        # Only the node itself, not the runnables nested inside it
+        if node is not None and kwargs.get("name") == node:
+            self._started[run_id] = (str(getattr(node, "value", node)), time.perf_counter())
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(run_id)
+
+    def on_chain_error(self, error, *, run_id: UUID, **kwargs: Any) -> None:
+        self._stop(run_id)
+
+    def _stop(self, run_id: UUID) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            node, started_at = started
+            self.durations[node].append(time.perf_counter() - started_at)
+
+
+def install_fakes(args, researchers: int, search) -> None:
+    """Swap every model and the search provider for the local stand-ins"""
+    import deepresearch.tools.tool as tool
+    from deepresearch.config.llm import LlmService
+    from deepresearch.config.metrics import get_llm_metrics
+    from deepresearch.core.constants import ModelRole
+
+    from benchmarks.fakes import ScriptedChatModel
+
+    def model(role: ModelRole, **kwargs) -> ScriptedChatModel:
+        return ScriptedChatModel(
+            role=role.value,
+            latency=args.llm_latency,
+            output_words=args.output_words,
+            callbacks=[get_llm_metrics().callback_handler],
+            metadata={"role": role.value},
+            **kwargs,
+        )
+
+    # The graphs bind their tools through the registry
+    LlmService.set_model(ModelRole.CLARIFIER, model(ModelRole.CLARIFIER))
+    LlmService.set_model(
+        ModelRole.SUPERVISOR, model(ModelRole.SUPERVISOR, researchers=researchers)
+    )
+    LlmService.set_model(
+        ModelRole.RESEARCHER,
+        model(ModelRole.RESEARCHER, searches_per_researcher=args.searches),
+    )
+    LlmService.set_model(ModelRole.COMPRESSOR, model(ModelRole.COMPRESSOR))
+    LlmService.set_model(ModelRole.SUMMARIZER, model(ModelRole.SUMMARIZER))
+    LlmService.set_model(ModelRole.WRITER, model(ModelRole.WRITER))
+
+    tool.search_multiple_async = search
+
+
+async def run_scenario(args, researchers: int, page_words: int) -> Dict[str, Any]:
+    from langchain_core.messages import HumanMessage
+
+    from deepresearch.agents.writer.graph import agent
+    from deepresearch.config.metrics import track_run_metrics
+
+    from benchmarks.fakes import FixtureSearch
+
+    search = FixtureSearch(latency=args.search_latency, page_words=page_words)
+    totals = []
+    timer = NodeTimer()
+    run_metrics = None
+    for round_index in range(args.rounds):
+        # Fresh models so every round replays the same script
+        install_fakes(args, researchers, search)
+        start = time.perf_counter()
+        with track_run_metrics() as run_metrics:
+            result = await agent.ainvoke(
+                {
+                    "messages": [
+                        HumanMessage(content="Research solid-state batteries")
+                    ]
+                },
+                config={
+                    "callbacks": [timer],
+                    "configurable": {
+                        "thread_id": f"bench-{researchers}-{page_words}-{round_index}"
+                    },
+                    "recursion_limit": 100,
+                },
+            )
+        totals.append(time.perf_counter() - start)
+        assert result.get("final_report"), "run finished without a report"
+
+    usage = run_metrics.summary()
+    return {
+        "researchers": researchers,
+        "page_words": page_words,
+        "total_s": _stats(totals),
+        "nodes": {
+            node: {
+                "runs_per_round": len(values) // args.rounds,
+                **_stats(values),
+            }
+            for node, values in sorted(timer.durations.items())
+        },
+        "search_calls_per_round": search.calls // args.rounds,
+        "llm": {
+            "calls": usage["calls"],
+            "prompt_tokens": usage["prompt_tokens"],
+            "completion_tokens": usage["completion_tokens"],
+            "roles": {
+                role: {
+                    "calls": values["calls"],
+                    "prompt_tokens": values["prompt_tokens"],
+                    "completion_tokens": values["completion_tokens"],
+                }
+                for role, values in usage["roles"].items()
+            },
+        },
+    }
+
+
+def _stats(values: List[float]) -> Dict[str, float]:
+    return {
+        "mean": round(statistics.mean(values), 4),
+        "min": round(min(values), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def configure_environment(cache_dir: str) -> None:
+    """Point configuration at local stand-ins; must run before importing deepresearch"""
+    for key in ("OPENAI_API_KEY", "TAVILY_API_KEY", "PPLX_API_KEY"):
+        os.environ.setdefault(key, "benchmark")
+    # Without an Opik key prompts are read from the bundled prompt files. An
+    # empty key, unlike a missing one, is not filled in from .env by load_dotenv
+    os.environ["OPIK_API_KEY"] = ""
+    os.environ["LLM_PROVIDER"] = "openai"
+    os.environ["DEEPRESEARCH_CACHE_DIR"] = cache_dir
+    # Caches would turn every round after the first into a replay
+    os.environ["SEARCH_CACHE_BACKEND"] = "none"
+    os.environ["SUMMARY_CACHE_ENABLED"] = "false"
+    os.environ["RESEARCH_CACHE_ENABLED"] = "false"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--researchers", type=_int_list, default=[1, 3])
+    parser.add_argument("--page-words", type=_int_list, default=[500, 4000])
+    parser.add_argument("--rounds", type=int, default=2, help="Runs per scenario")
+    parser.add_argument("--searches", type=int, default=2, help="Per researcher")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="Seconds")
+    parser.add_argument("--output-words", type=int, default=200)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        configure_environment(cache_dir)
+        scenarios = [
+            asyncio.run(run_scenario(args, researchers, page_words))
+            for researchers in args.researchers
+            for page_words in args.page_words
+        ]
+
+    results = json.dumps(
+        {
+            "rounds": args.rounds,
+            "searches_per_researcher": args.searches,
+            "llm_latency_s": args.llm_latency,
+            "search_latency_s": args.search_latency,
+            "scenarios": scenarios,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(results + "\n")
+    print(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""Deterministic local stand-ins for the LLM and search providers.
+
+``ScriptedChatModel`` plays every model role of the agent with canned but
+realistic behaviour: the supervisor delegates to a fixed number of
+researchers, each researcher searches, reflects with ``think_tool`` and then
+answers, and structured outputs are returned as tool calls so LangChain's own
+parsers and callbacks run as they would against a real provider.
+``FixtureSearch`` serves generated pages of a fixed size with a configurable
+latency in place of the search providers.
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+WORDS = (
+    "market growth adoption battery energy density cost manufacturing supply "
+    "chain policy regulation research study results analysis performance "
+    "efficiency capacity demand forecast investment technology deployment "
+    "the of and to in for with on by from that this is are was were"
+).split()
+
+NAVIGATION = [
+    "[Home](/)",
+    "[News](/news)",
+    "[About us](/about)",
+    "Sign in",
+    "Subscribe to our newsletter",
+    "Accept all cookies",
+]
+FOOTER = ["Privacy policy", "Terms of service", "© 2025 Fixture Media. All rights reserved."]
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _seed(text: str) -> int:
+    return zlib.crc32(text.encode())
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model that follows a fixed research script for its role"""
+
+    role: str
+    model_name: str = "scripted"
+    latency: float = 0.05
+    researchers: int = 3
+    searches_per_researcher: int = 2
+    output_words: int = 200
+    tool_names: List[str] = []
+
+    # Turns taken per research topic; researchers run concurrently
+    _turns: Dict[str, int] = PrivateAttr(default_factory=dict)
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs: Any) -> "ScriptedChatModel":
+        tool_names = [convert_to_openai_tool(t)["function"]["name"] for t in tools]
+        bound = self.model_copy(update={"tool_names": tool_names})
+        bound._turns = self._turns
+        return bound
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return self._result(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return self._result(messages)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        message = self._respond(messages)
+        if message.tool_calls:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": call["name"],
+                            "args": json.dumps(call["args"]),
+                            "id": call["id"],
+                            "index": index,
+                        }
+                        for index, call in enumerate(message.tool_calls)
+                    ],
+                )
+            )
+            return
+
+        for word in message.content.split(" "):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=word + " "))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _result(self, messages: List[BaseMessage]) -> ChatResult:
+        message = self._respond(messages)
+        message.usage_metadata = {
+            "input_tokens": count_tokens_approximately(messages),
+            "output_tokens": count_tokens_approximately([message]),
+            "total_tokens": 0,
+        }
+        message.usage_metadata["total_tokens"] = (
+            message.usage_metadata["input_tokens"]
+            + message.usage_metadata["output_tokens"]
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _respond(self, messages: List[BaseMessage]) -> AIMessage:
+        # Structured output is requested by binding the schema as the only tool
+        if len(self.tool_names) == 1 and self.tool_names[0] in STRUCTURED_OUTPUTS:
+            name = self.tool_names[0]
+            return _tool_calls([(name, STRUCTURED_OUTPUTS[name](self))])
+        if self.role == "supervisor":
+            return self._supervise(messages)
+        if self.role == "researcher":
+            return self._research(messages)
+        return AIMessage(content=_words(random.Random(len(messages)), self.output_words))
+
+    def _supervise(self, messages: List[BaseMessage]) -> AIMessage:
+        delegated = any(
+            getattr(message, "name", None) == "ConductResearch" for message in messages
+        )
+        if delegated:
+            return _tool_calls([("ResearchComplete", {})])
+        return _tool_calls(
+            [
+                (
+                    "ConductResearch",
+                    {"research_topic": f"Research subtopic {i} of the brief in depth"},
+                )
+                for i in range(self.researchers)
+            ]
+        )
+
+    def _research(self, messages: List[BaseMessage]) -> AIMessage:
+        topic = str(next(m.content for m in messages if m.type == "human"))
+        turn = self._turns.get(topic, 0)
+        self._turns[topic] = turn + 1
+
+        # Alternate searches with reflections, as the research prompt asks
+        if turn < 2 * self.searches_per_researcher:
+            if turn % 2 == 0:
+                return _tool_calls(
+                    [("tavily_search", {"query": f"{topic[:40]} aspect {turn // 2}"})]
+                )
+            return _tool_calls(
+                [("think_tool", {"reflection": "Found relevant sources, continuing."})]
+            )
+        return AIMessage(content=_words(random.Random(_seed(topic)), self.output_words))
+
+
+STRUCTURED_OUTPUTS = {
+    "ClarifyWithUser": lambda model: {
+        "need_clarification": False,
+        "question": "",
+        "verification": "I have enough information and will start the research now.",
+    },
+    "ResearchQuestion": lambda model: {
+        "research_brief": "Investigate the current state of solid-state battery "
+        "technology, its energy density, cost and manufacturing outlook."
+    },
+    "Summary": lambda model: {
+        "summary": _words(random.Random(1), model.output_words // 2),
+        "key_excerpts": _words(random.Random(2), model.output_words // 4),
+    },
+}
+
+_call_ids = itertools.count(1)
+
+
+def _tool_calls(calls) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": args, "id": f"call_{next(_call_ids)}"}
+            for name, args in calls
+        ],
+    )
+
+
+class FixtureSearch:
+    """Replacement for ``search_multiple_async`` serving generated pages.
+
+    Pages are derived from the query with a fixed seed, so every run sees the
+    same content. URLs are drawn from a shared pool so that researchers find
+    overlapping sources, as they do against the real API.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        page_words: int = 2000,
+        url_pool: int = 8,
+    ):
+        self.latency = latency
+        self.page_words = page_words
+        self.url_pool = url_pool
+        self.calls = 0
+
+    async def __call__(
+        self,
+        search_queries: List[str],
+        max_results: int = 3,
+        topic: str = "general",
+        include_raw_content: bool = True,
+    ) -> List[dict]:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return [self._response(query, max_results) for query in search_queries]
+
+    def _response(self, query: str, max_results: int) -> dict:
+        first = _seed(query) % self.url_pool
+        results = []
+        for i in range(max_results):
+            page = (first + i) % self.url_pool
+            results.append(
+                {
+                    "url": f"https://fixtures.local/articles/{page}?utm_source=search",
+                    "title": f"Fixture article {page}",
+                    "content": f"Snippet of fixture article {page} about {query}",
+                    "raw_content": self.page(page, query),
+                    "score": 1.0 / (i + 1),
+                }
+            )
+        return {"query": query, "results": results}
+
+    def page(self, page: int, query: Optional[str] = None) -> str:
+        rng = random.Random(page)
+        lines = list(NAVIGATION) + [f"# Fixture article {page}", ""]
+        written = 0
+        while written < self.page_words:
+            paragraph = _words(rng, 80)
+            if query and rng.random() < 0.2:
+                paragraph += f" {query}."
+            lines += [paragraph, ""]
+            written += 80
+        return "\n".join(lines + FOOTER)
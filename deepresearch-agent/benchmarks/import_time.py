@@ -0,0 +1,133 @@
+"""Benchmark the cold import time of the API and the agent graphs.
+
+Each round imports the module in a fresh interpreter, as a uvicorn reload or
+a new worker would, and reports the wall-clock import time, the slowest
+modules from ``-X importtime`` and any network connection attempted during
+the import. Importing must not require API keys or reach the network, so the
+benchmark runs with placeholder keys and fails if a connection is attempted.
+
+Usage:
+    python -m benchmarks.import_time --module deepresearch.interface.main \\
+        --rounds 5 --output import.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+# Runs in the child interpreter: records connection attempts, then imports
+PROBE = """
+import json, socket, sys, time
+
+attempts = []
+_connect = socket.socket.connect
+
+def connect(self, address):
+    attempts.append(repr(address))
+    return _connect(self, address)
+
+socket.socket.connect = connect
+socket.socket.connect_ex = connect
+
+start = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "connections": attempts}))
+"""
+
+
+def run_once(module: str, env: Dict[str, str]) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, module],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["modules"] = _parse_importtime(completed.stderr)
+    return result
+
+
+def _parse_importtime(stderr: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module imported"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _environment(cache_dir: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    for key in ("OPENAI_API_KEY", "TAVILY_API_KEY", "PPLX_API_KEY"):
+        env.setdefault(key, "benchmark")
+    # Empty rather than unset, so that load_dotenv does not restore it from .env
+    env["OPIK_API_KEY"] = ""
+    env["DEEPRESEARCH_CACHE_DIR"] = cache_dir
+    # Let the first round write bytecode, so the averaged rounds are warm
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="deepresearch.interface.main")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules shown")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = _environment(cache_dir)
+        # The first import compiles bytecode; it is reported but not averaged
+        runs: List[Dict[str, Any]] = [
+            run_once(args.module, env) for _ in range(args.rounds + 1)
+        ]
+
+    warm = runs[1:] or runs
+    seconds = [run["seconds"] for run in warm]
+    slowest = sorted(
+        warm[-1]["modules"].items(), key=lambda item: item[1], reverse=True
+    )[: args.top]
+    connections = sorted({address for run in runs for address in run["connections"]})
+
+    results = json.dumps(
+        {
+            "module": args.module,
+            "rounds": len(warm),
+            "first_import_s": round(runs[0]["seconds"], 4),
+            "import_s": {
+                "mean": round(statistics.mean(seconds), 4),
+                "min": round(min(seconds), 4),
+                "max": round(max(seconds), 4),
+            },
+            "modules_imported": len(warm[-1]["modules"]),
+            "slowest_modules_ms": {
+                name: round(micros / 1000, 1) for name, micros in slowest
+            },
+            "network_connections": connections,
+        },
+        indent=2,
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(results + "\n")
+    print(results)
+
+    if connections:
+        sys.exit(f"Importing {args.module} attempted network connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark the Tavily search backends against a local stub server.
+
+Measures wall-clock time per multi-query batch for the sequential search path
+(queries issued one after another, as ``tavily_search_multiple`` does) and the
+pooled concurrent path (``tavily_search_multiple_async``). No network access or
+API key is required.
+
+Usage:
+    python -m benchmarks.tavily_search --queries 5 --latency 0.3 --rounds 3
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_stub_handler(latency: float, raw_content_size: int):
+    """Build a request handler that mimics the Tavily /search endpoint"""
+
+    class StubTavilyHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(latency)
+
+            query = payload.get("query", "")
+            results = [
+                {
+                    "url": f"https://example.com/{abs(hash(query))}/{i}",
+                    "title": f"{query} - result {i}",
+                    "content": f"Snippet {i} for {query}",
+                    "raw_content": "x" * raw_content_size
+                    if payload.get("include_raw_content")
+                    else None,
+                    "score": 1.0 / (i + 1),
+                }
+                for i in range(payload.get("max_results", 3))
+            ]
+            body = json.dumps({"query": query, "results": results}).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubTavilyHandler
+
+
+def start_stub_server(latency: float, raw_content_size: int) -> ThreadingHTTPServer:
+    """Start the stub server on a free local port in a daemon thread"""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), make_stub_handler(latency, raw_content_size)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run_benchmark(queries: int, rounds: int) -> dict:
+    # Imported lazily so the stub URL/key set in main() are picked up by config.
+    from deepresearch.tools.tavilyapi import (
+        _tavily_search_async,
+        close_async_tavily_client,
+        tavily_search_multiple_async,
+    )
+
+    batch = [f"benchmark query {i}" for i in range(queries)]
+
+    async def sequential():
+        return [await _tavily_search_async(q, 3, "general", True) for q in batch]
+
+    async def concurrent():
+        return await tavily_search_multiple_async(batch)
+
+    timings = {"sequential": [], "concurrent": []}
+    for _ in range(rounds):
+        for name, fn in (("sequential", sequential), ("concurrent", concurrent)):
+            start = time.perf_counter()
+            results = await fn()
+            timings[name].append(time.perf_counter() - start)
+            assert len(results) == queries
+
+    await close_async_tavily_client()
+    return {
+        name: {
+            "mean_s": round(statistics.mean(values), 4),
+            "min_s": round(min(values), 4),
+            "max_s": round(max(values), 4),
+        }
+        for name, values in timings.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=5, help="Queries per batch")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub latency (s)")
+    parser.add_argument("--rounds", type=int, default=3, help="Batches per backend")
+    parser.add_argument("--raw-content-size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency, args.raw_content_size)
+    os.environ["TAVILY_API_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("TAVILY_API_KEY", "tvly-benchmark")
+
+    try:
+        results = asyncio.run(run_benchmark(args.queries, args.rounds))
+    finally:
+        server.shutdown()
+
+    print(
+        json.dumps(
+            {
+                "queries_per_batch": args.queries,
+                "stub_latency_s": args.latency,
+                "rounds": args.rounds,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import time
+from typing import NamedTuple, Optional
+
+from langchain_core.messages import AIMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import RunnableConfig
+
+from deepresearch.config.env import (
+    RESEARCHER_MAX_TOKENS,
+    RESEARCHER_MAX_TOOL_CALLS,
+    RESEARCHER_TIMEOUT,
+)
+from deepresearch.core.constants import ConfigClass
+from deepresearch.core.deadline import remaining_run_time
+from deepresearch.core.state import ResearcherState
+
+
+class ResearchBudget(NamedTuple):
+    """Hard limits of one research unit, 0 disables a limit"""
+
+    max_tool_calls: int
+    max_tokens: int
+    # Seconds from the unit's first LLM call
+    timeout: float
+
+
+def research_budget(config: Optional[RunnableConfig]) -> ResearchBudget:
+    """The budget of a research unit, overridable per request through configurable"""
+    configurable = (config or {}).get(ConfigClass.CONFIGURABLE, {})
+
+    def limit(key: ConfigClass, default, cast):
+        value = configurable.get(key)
+        return default if value is None else cast(value)
+
+    return ResearchBudget(
+        max_tool_calls=limit(
+            ConfigClass.RESEARCHER_MAX_TOOL_CALLS, RESEARCHER_MAX_TOOL_CALLS, int
+        ),
+        max_tokens=limit(ConfigClass.RESEARCHER_MAX_TOKENS, RESEARCHER_MAX_TOKENS, int),
+        timeout=limit(ConfigClass.RESEARCHER_TIMEOUT, RESEARCHER_TIMEOUT, float),
+    )
+
+
+def started_at(state: ResearcherState) -> float:
+    return state.get(ConfigClass.RESEARCH_STARTED_AT) or time.time()
+
+
+def remaining_time(state: ResearcherState, budget: ResearchBudget) -> Optional[float]:
+    """Seconds left before the unit's or the run's deadline, None without either"""
+    remaining = []
+    if budget.timeout:
+        remaining.append(started_at(state) + budget.timeout - time.time())
+    run_remaining = remaining_run_time()
+    if run_remaining is not None:
+        remaining.append(run_remaining)
+    return max(0.0, min(remaining)) if remaining else None
+
+
+def remaining_tool_calls(
+    state: ResearcherState, budget: ResearchBudget
+) -> Optional[int]:
+    if not budget.max_tool_calls:
+        return None
+    used = state.get(ConfigClass.TOOL_CALL_INTERATIONS) or 0
+    return max(0, budget.max_tool_calls - used)
+
+
+def exhausted_budget(state: ResearcherState, budget: ResearchBudget) -> Optional[str]:
+    """Name of the first exhausted budget, None while every budget has room"""
+    if remaining_tool_calls(state, budget) == 0:
+        return "tool calls"
+    if budget.max_tokens and (
+        (state.get(ConfigClass.RESEARCH_TOKENS) or 0) >= budget.max_tokens
+    ):
+        return "tokens"
+    if remaining_time(state, budget) == 0:
+        return "time"
+    return None
+
+
+def tokens_used(prompt_messages, response: AIMessage) -> int:
+    """Tokens of one LLM call, as reported by the provider or estimated"""
+    usage = getattr(response, "usage_metadata", None)
+    if usage and usage.get("total_tokens"):
+        return usage["total_tokens"]
+    return count_tokens_approximately(list(prompt_messages) + [response])
@@ -0,0 +1,171 @@
+import logging
+import re
+from typing import List
+
+import numpy as np
+
+from deepresearch.config.env import EXTRACTION_PASSAGE_WORDS, EXTRACTION_TOKEN_BUDGET
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in characters, used to budget passages without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_MARKDOWN_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MARKDOWN_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_BARE_URL = re.compile(r"https?://\S+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+# Whole lines of navigation, consent banners and footers
+_BOILERPLATE = re.compile(
+    r"(accept|reject|manage)( all)? cookies|cookie (settings|preferences|policy)|"
+    r"privacy policy|terms of (use|service)|(©|copyright) .*|.*all rights reserved|"
+    r"sign (in|up|out)|log ?(in|out)|subscribe|"
+    r"(sign up for|subscribe to) (our|the) newsletter|skip to (main )?content|"
+    r"share (on|this)( \w+)?|follow us( on \w+)?|advertisement",
+    re.IGNORECASE,
+)
+# Figures and table rows carry data even in a word or two
+_DATA = re.compile(r"\d|\|")
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def strip_boilerplate(webpage_content: str) -> List[str]:
+    """Clean a page into paragraphs, dropping navigation, footers and repeats"""
+    paragraphs: List[str] = []
+    current: List[str] = []
+    seen_lines = set()
+
+    def flush():
+        if current:
+            paragraphs.append(" ".join(current))
+            current.clear()
+
+    for line in webpage_content.splitlines():
+        line = _MARKDOWN_IMAGE.sub("", line)
+        line = _MARKDOWN_LINK.sub(r"\1", line)
+        line = _BARE_URL.sub("", line)
+        line = " ".join(line.split())
+        if not line:
+            flush()
+            continue
+
+        words = len(line.split())
+        is_heading = line.startswith("#")
+        # Menus and footers repeat the same short lines across the page
+        if line.lower() in seen_lines and words < 20:
+            continue
+        seen_lines.add(line.lower())
+        if words < 20 and _BOILERPLATE.fullmatch(line.rstrip(".!:| ")):
+            continue
+        if words < 3 and not is_heading and not _DATA.search(line):
+            continue
+
+        if is_heading:
+            flush()
+        current.append(line)
+
+    flush()
+    return paragraphs
+
+
+def split_passages(
+    paragraphs: List[str], passage_words: int = EXTRACTION_PASSAGE_WORDS
+) -> List[str]:
+    """Pack paragraphs into passages of about ``passage_words`` words"""
+    passages: List[str] = []
+    current: List[str] = []
+    current_words = 0
+
+    def flush():
+        nonlocal current_words
+        if current:
+            passages.append(" ".join(current))
+            current.clear()
+            current_words = 0
+
+    for paragraph in paragraphs:
+        # Split long paragraphs on sentence boundaries
+        for sentence in _SENTENCE_END.split(paragraph):
+            words = len(sentence.split())
+            if current_words and current_words + words > passage_words:
+                flush()
+            current.append(sentence)
+            current_words += words
+        if current_words >= passage_words // 2:
+            flush()
+
+    flush()
+    return passages
+
+
+def bm25_scores(passages: List[str], query: str) -> np.ndarray:
+    """BM25 relevance of each passage to the query"""
+    # scikit-learn is slow to import and only needed once pages are extracted
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    vectorizer = CountVectorizer(stop_words="english")
+    try:
+        term_counts = vectorizer.fit_transform(passages)
+    except ValueError:
+        # Only stop words in the passages
+        return np.zeros(len(passages))
+
+    query_terms = vectorizer.transform([query]).indices
+    if not len(query_terms):
+        return np.zeros(len(passages))
+
+    n_passages = term_counts.shape[0]
+    doc_freq = np.bincount(term_counts.indices, minlength=term_counts.shape[1])
+    idf = np.log((n_passages - doc_freq + 0.5) / (doc_freq + 0.5) + 1.0)
+
+    lengths = np.asarray(term_counts.sum(axis=1)).ravel()
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / max(lengths.mean(), 1))
+
+    tf = term_counts[:, query_terms].toarray()
+    scores = tf * (BM25_K1 + 1) / (tf + norm[:, None]) * idf[query_terms]
+    return scores.sum(axis=1)
+
+
+def extract_relevant_content(
+    webpage_content: str,
+    query: str,
+    token_budget: int = EXTRACTION_TOKEN_BUDGET,
+) -> str:
+    """Reduce a page to the passages most relevant to the query.
+
+    Boilerplate is stripped first; if the cleaned page still exceeds
+    ``token_budget`` it is split into passages, ranked with BM25 against the
+    query, and the best passages that fit the budget are kept in page order.
+    """
+    paragraphs = strip_boilerplate(webpage_content)
+    cleaned = "\n\n".join(paragraphs)
+    if not cleaned:
+        return webpage_content[: token_budget * CHARS_PER_TOKEN]
+    if estimate_tokens(cleaned) <= token_budget:
+        return cleaned
+
+    passages = split_passages(paragraphs)
+    scores = bm25_scores(passages, query)
+
+    selected = []
+    used = 0
+    # Stable sort keeps earlier passages first among equal scores
+    for index in np.argsort(-scores, kind="stable"):
+        tokens = estimate_tokens(passages[index])
+        if used + tokens > token_budget:
+            continue
+        selected.append(index)
+        used += tokens
+
+    logger.debug(
+        f"Extracted {len(selected)}/{len(passages)} passages "
+        f"({used}/{estimate_tokens(webpage_content)} tokens)"
+    )
+    return "\n\n".join(passages[index] for index in sorted(selected))
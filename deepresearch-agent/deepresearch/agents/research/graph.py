@@ -1,53 +1,141 @@
+import asyncio
+import logging
+import time
 from typing import Literal
 
 from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
     HumanMessage,
     SystemMessage,
     ToolMessage,
     filter_messages,
+    get_buffer_string,
 )
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 
+from deepresearch.agents.research.budget import (
+    exhausted_budget,
+    remaining_time,
+    remaining_tool_calls,
+    research_budget,
+    started_at,
+    tokens_used,
+)
+from deepresearch.config.env import (
+    RESEARCH_COMPACTION_ENABLED,
+    RESEARCH_COMPACTION_KEEP_ROUNDS,
+    RESEARCH_COMPACTION_THRESHOLD,
+)
 from deepresearch.config.llm import LlmService
-from deepresearch.core.constants import ConfigClass, GraphNode, OpikPrompts
+from deepresearch.core.constants import (
+    ConfigClass,
+    GraphNode,
+    ModelRole,
+    OpikPrompts,
+)
 from deepresearch.core.opik_prompts import Opik_prompts
 from deepresearch.core.state import ResearcherOutputState, ResearcherState
-from deepresearch.tools.tool import tavily_search, think_tool
+from deepresearch.tools.tool import async_tavily_search, think_tool
 from deepresearch.tools.utils import get_today_str
 
-from deepresearch.config.gemini_models import GeminiModel
+logger = logging.getLogger(__name__)
 
-tools = [tavily_search, think_tool]
+tools = [async_tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
+# Reflections cost no search, so they do not count against the tool call budget
+UNBUDGETED_TOOLS = {think_tool.name}
+
+TIME_BUDGET_EXHAUSTED = (
+    "The time budget of this research unit is exhausted. "
+    "Wrapping up with the findings gathered so far."
+)
+TOOL_CALL_NOT_RUN = "Not run: the {budget} budget of this research unit is exhausted."
 
-model = LlmService.get_model()
-model_with_tools = model.bind_tools(tools)
 
-summarization_model = LlmService.get_model()
-compress_model = LlmService.get_model()
+def working_messages(state: ResearcherState) -> list[BaseMessage]:
+    """The researcher history with digested tool rounds replaced by the digest"""
+    messages = list(state[ConfigClass.RESEARCHER_MESSAGES])
+    digest = state.get(ConfigClass.RESEARCH_DIGEST)
+    if not digest:
+        return messages
 
+    digested = state.get(ConfigClass.DIGESTED_MESSAGES) or 1
+    digest_message = HumanMessage(
+        content=f"Findings from your earlier searches:\n\n"
+        f"<research_digest>\n{digest}\n</research_digest>"
+    )
+    return messages[:1] + [digest_message] + messages[digested:]
 
-def llm_call(state: ResearcherState):
+
+async def llm_call(state: ResearcherState, config: RunnableConfig):
     """Analyze the current state and determine the next step"""
+    budget = research_budget(config)
 
     research_agent_prompt = Opik_prompts.get_prompt(
         prompt_name=OpikPrompts.RESEARCH_AGENT_PROMPT
     )
 
-    response = model_with_tools.invoke(
-        [SystemMessage(content=research_agent_prompt)]
-        + state[ConfigClass.RESEARCHER_MESSAGES]
-    )
-    return {ConfigClass.RESEARCHER_MESSAGES: [response]}
+    messages = [SystemMessage(content=research_agent_prompt)] + working_messages(state)
+    model_with_tools = LlmService.get_model(ModelRole.RESEARCHER, tools=tools)
+    # The unit's clock starts before its first LLM call, not after it
+    start = started_at(state)
+    try:
+        response = await asyncio.wait_for(
+            model_with_tools.ainvoke(messages), timeout=remaining_time(state, budget)
+        )
+    except asyncio.TimeoutError:
+        # No tool calls, so the unit goes on to compress_research
+        response = AIMessage(content=TIME_BUDGET_EXHAUSTED)
 
+    return {
+        ConfigClass.RESEARCHER_MESSAGES: [response],
+        ConfigClass.RESEARCH_TOKENS: (state.get(ConfigClass.RESEARCH_TOKENS) or 0)
+        + tokens_used(messages, response),
+        ConfigClass.RESEARCH_STARTED_AT: start,
+    }
 
-def tool_node(state: ResearcherState):
+
+async def tool_node(state: ResearcherState, config: RunnableConfig):
+    """Execute the tool calls of the last AI message concurrently, within budget"""
+    budget = research_budget(config)
     tool_calls = state[ConfigClass.RESEARCHER_MESSAGES][-1].tool_calls
 
-    observations = []
+    # Searches beyond the tool call budget are answered without running them
+    allowed = remaining_tool_calls(state, budget)
+    budgeted = 0
+    tasks = []
     for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
+        if tool_call["name"] not in UNBUDGETED_TOOLS:
+            if allowed is not None and budgeted >= allowed:
+                tasks.append(None)
+                continue
+            budgeted += 1
+        tasks.append(
+            asyncio.ensure_future(
+                tools_by_name[tool_call["name"]].ainvoke(tool_call["args"])
+            )
+        )
+
+    started = [task for task in tasks if task is not None]
+    pending = set()
+    if started:
+        _, pending = await asyncio.wait(
+            started, timeout=remaining_time(state, budget)
+        )
+        for task in pending:
+            task.cancel()
+
+    observations = []
+    for task in tasks:
+        if task is None:
+            observations.append(TOOL_CALL_NOT_RUN.format(budget="tool call"))
+        elif task in pending:
+            observations.append(TOOL_CALL_NOT_RUN.format(budget="time"))
+        else:
+            observations.append(task.result())
 
     tool_outputs = [
         ToolMessage(
@@ -55,25 +143,90 @@ def tool_node(state: ResearcherState):
         )
         for observation, tool_call in zip(observations, tool_calls)
     ]
-    state[ConfigClass.RESEARCHER_MESSAGES] = tool_outputs
-    return state
+    return {
+        ConfigClass.RESEARCHER_MESSAGES: tool_outputs,
+        ConfigClass.TOOL_CALL_INTERATIONS: (
+            state.get(ConfigClass.TOOL_CALL_INTERATIONS) or 0
+        )
+        + budgeted,
+    }
+
+
+def _compaction_cut(messages: list[BaseMessage], digested: int) -> int:
+    """Index up to which messages can be folded, keeping the latest tool rounds"""
+    if RESEARCH_COMPACTION_KEEP_ROUNDS <= 0:
+        return len(messages)
+
+    round_starts = [
+        index
+        for index, message in enumerate(messages)
+        if index >= digested and isinstance(message, AIMessage)
+    ]
+    if len(round_starts) <= RESEARCH_COMPACTION_KEEP_ROUNDS:
+        return digested
+    # Cutting at an AI message keeps tool calls and their results together
+    return round_starts[-RESEARCH_COMPACTION_KEEP_ROUNDS]
 
 
-def compress_research(state: ResearcherState):
+def should_compact(
+    state: ResearcherState, config: RunnableConfig
+) -> Literal[GraphNode]:
+    if _stop_research(state, config):
+        return GraphNode.COMPRESS_RESEARCH
+    if not RESEARCH_COMPACTION_ENABLED:
+        return GraphNode.LLM_CALL
+
+    messages = state[ConfigClass.RESEARCHER_MESSAGES]
+    digested = state.get(ConfigClass.DIGESTED_MESSAGES) or 1
+    if count_tokens_approximately(messages[digested:]) <= RESEARCH_COMPACTION_THRESHOLD:
+        return GraphNode.LLM_CALL
+    if _compaction_cut(messages, digested) <= digested:
+        return GraphNode.LLM_CALL
+    return GraphNode.COMPACT_CONTEXT
+
+
+async def compact_context(state: ResearcherState):
+    """Fold older tool rounds into the running research digest"""
+    messages = state[ConfigClass.RESEARCHER_MESSAGES]
+    digested = state.get(ConfigClass.DIGESTED_MESSAGES) or 1
+    cut = _compaction_cut(messages, digested)
+
+    prompt = Opik_prompts.get_prompt(prompt_name=OpikPrompts.COMPACT_RESEARCH_PROMPT)
+    compact_prompt = prompt.format(
+        date=get_today_str(),
+        research_topic=state.get(ConfigClass.RESEARCH_TOPIC, ""),
+        digest=state.get(ConfigClass.RESEARCH_DIGEST) or "No findings yet.",
+        findings=get_buffer_string(messages[digested:cut]),
+    )
+    compact_messages = [HumanMessage(content=compact_prompt)]
+    compress_model = LlmService.get_model(ModelRole.COMPRESSOR)
+    response = await compress_model.ainvoke(compact_messages)
+
+    return {
+        ConfigClass.RESEARCH_DIGEST: str(response.content),
+        ConfigClass.DIGESTED_MESSAGES: cut,
+        ConfigClass.RESEARCH_TOKENS: (state.get(ConfigClass.RESEARCH_TOKENS) or 0)
+        + tokens_used(compact_messages, response),
+    }
+
+
+async def compress_research(state: ResearcherState):
     prompt = Opik_prompts.get_prompt(
         prompt_name=OpikPrompts.COMPRESS_RESEACH_SYSTEM_PROMPT
     )
     compress_research_human_prompt = Opik_prompts.get_prompt(
         prompt_name=OpikPrompts.COMPRESS_RESEACH_HUMAN_MESSAGE
-    )
+    ).format(research_topic=state.get(ConfigClass.RESEARCH_TOPIC, ""))
     compress_research_system_prompt = prompt.format(date=get_today_str())
+    # Starts from the running digest rather than the full transcript
     messages = (
         [SystemMessage(content=compress_research_system_prompt)]
-        + state.get(ConfigClass.RESEARCHER_MESSAGES, [])
+        + _drop_unanswered_tool_calls(working_messages(state))
         + [HumanMessage(content=compress_research_human_prompt)]
     )
 
-    response = compress_model.invoke(messages)
+    compress_model = LlmService.get_model(ModelRole.COMPRESSOR)
+    response = await compress_model.ainvoke(messages)
 
     raw_notes = [
         str(m.content)
@@ -86,11 +239,32 @@ def compress_research(state: ResearcherState):
     return state
 
 
-def should_continue(state: ResearcherState) -> Literal[GraphNode]:
+def _drop_unanswered_tool_calls(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Remove tool calls left unanswered when a budget stopped the unit"""
+    last = messages[-1] if messages else None
+    if not (isinstance(last, AIMessage) and last.tool_calls):
+        return messages
+    # Keep whatever the researcher wrote alongside the calls
+    return messages[:-1] + ([AIMessage(content=last.content)] if last.content else [])
+
+
+def _stop_research(state: ResearcherState, config: RunnableConfig) -> bool:
+    exhausted = exhausted_budget(state, research_budget(config))
+    if exhausted:
+        logger.info(
+            f"Research unit out of its {exhausted} budget, compressing findings: "
+            f"{state.get(ConfigClass.RESEARCH_TOPIC, '')[:80]}"
+        )
+    return bool(exhausted)
+
+
+def should_continue(
+    state: ResearcherState, config: RunnableConfig
+) -> Literal[GraphNode]:
     messages = state[ConfigClass.RESEARCHER_MESSAGES]
     last_messages = messages[-1]
 
-    if last_messages.tool_calls:
+    if last_messages.tool_calls and not _stop_research(state, config):
         return GraphNode.TOOL_NODE
 
     return GraphNode.COMPRESS_RESEARCH
@@ -101,6 +275,7 @@ def create_research_workflow():
 
     builder.add_node(GraphNode.LLM_CALL, llm_call)
     builder.add_node(GraphNode.TOOL_NODE, tool_node)
+    builder.add_node(GraphNode.COMPACT_CONTEXT, compact_context)
     builder.add_node(GraphNode.COMPRESS_RESEARCH, compress_research)
 
     builder.add_edge(GraphNode.START, GraphNode.LLM_CALL)
@@ -113,7 +288,16 @@ def create_research_workflow():
         },
     )
 
-    builder.add_edge(GraphNode.TOOL_NODE, GraphNode.LLM_CALL)
+    builder.add_conditional_edges(
+        GraphNode.TOOL_NODE,
+        should_compact,
+        {
+            GraphNode.COMPACT_CONTEXT: GraphNode.COMPACT_CONTEXT,
+            GraphNode.LLM_CALL: GraphNode.LLM_CALL,
+            GraphNode.COMPRESS_RESEARCH: GraphNode.COMPRESS_RESEARCH,
+        },
+    )
+    builder.add_edge(GraphNode.COMPACT_CONTEXT, GraphNode.LLM_CALL)
     builder.add_edge(GraphNode.COMPRESS_RESEARCH, GraphNode.END)
 
     return builder
@@ -1,38 +1,158 @@
-from typing import List
-
-from deepresearch.agents.research.summarizer import summarize_webpage_content
+import asyncio
+import logging
+from typing import List, Optional
+
+from deepresearch.agents.research.near_duplicates import (
+    NearDuplicateIndex,
+    minhash_signature,
+)
+from deepresearch.agents.research.sources import SourceRegistry, canonicalize_url
+from deepresearch.agents.research.summarizer import (
+    asummarize_webpage_content,
+    summarize_webpage_content,
+)
+from deepresearch.config.env import (
+    NEAR_DUPLICATE_ENABLED,
+    SUMMARIZATION_MAX_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def deduplicate_search_results(search_results: List[dict]) -> dict:
-    """Deduplicate search results by URL to avoid processing duplicate content"""
+    """Deduplicate search results by canonical URL to avoid processing duplicate content.
+
+    Results are keyed by canonical URL and keep the URL the provider returned.
+    """
     unique_results = {}
 
     for response in search_results:
         for result in response["results"]:
-            url = result["url"]
+            url = canonicalize_url(result["url"])
             if url not in unique_results:
                 unique_results[url] = result
 
     return unique_results
 
 
-def process_search_results(unique_results: dict) -> dict:
+def drop_near_duplicates(
+    unique_results: dict, index: Optional[NearDuplicateIndex] = None
+) -> dict:
+    """Merge pages whose content nearly duplicates another page.
+
+    Within the results, later copies are dropped and their URLs listed under
+    ``duplicate_urls`` of the page kept. A page copying one already in the
+    run's ``index`` is kept but marked ``duplicate_of`` that page, so that its
+    summary is reused instead of summarizing the copy again.
+    """
+    if not NEAR_DUPLICATE_ENABLED:
+        return unique_results
+
+    index = index if index is not None else NearDuplicateIndex()
+    batch = NearDuplicateIndex(index.threshold)
+    kept = {}
+    dropped = merged = 0
+
+    for url, result in unique_results.items():
+        signature = minhash_signature(result.get("raw_content") or "")
+        original = batch.find(signature)
+        if original is not None:
+            kept[original].setdefault("duplicate_urls", []).append(result["url"])
+            dropped += 1
+            continue
+        batch.add(url, signature)
+
+        result = dict(result)
+        run_original = index.find(signature)
+        if run_original is None:
+            index.add(url, signature)
+        elif run_original != url:
+            result["duplicate_of"] = run_original
+            merged += 1
+        kept[url] = result
+
+    if dropped or merged:
+        index.dropped += dropped
+        index.merged += merged
+        logger.info(
+            f"Near-duplicate pages: {dropped} dropped, {merged} merged "
+            f"with pages seen earlier in the run"
+        )
+    return kept
+
+
+def process_search_results(unique_results: dict, query: Optional[str] = None) -> dict:
     """Process search results by summarizing content where available."""
     summarized_results = {}
 
-    for url, result in unique_results.items():
+    for url, result in drop_near_duplicates(unique_results).items():
         # Use existing content if no raw content for summarization
         if not result.get("raw_content"):
             content = result["content"]
         else:
             # Summarize raw content for better processing
-            content = summarize_webpage_content(result["raw_content"])
+            content = summarize_webpage_content(result["raw_content"], query)
 
-        summarized_results[url] = {"title": result["title"], "content": content}
+        summarized_results[url] = _summarized(result, content)
 
     return summarized_results
 
 
+async def aprocess_search_results(
+    unique_results: dict,
+    query: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    registry: Optional[SourceRegistry] = None,
+) -> dict:
+    """Process search results by summarizing all pages concurrently.
+
+    At most ``max_concurrency`` summarizations (SUMMARIZATION_MAX_CONCURRENCY by
+    default) run at once. The output keeps the order of ``unique_results``.
+    When a query is given, pages are first reduced to their relevant passages.
+    With a run's source registry, pages already summarized or being summarized
+    by another researcher of the run are not summarized again, and neither are
+    near-duplicate copies of them.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or SUMMARIZATION_MAX_CONCURRENCY)
+    registry = registry or SourceRegistry()
+    # Hashing the pages is CPU-bound as well
+    unique_results = await asyncio.to_thread(
+        drop_near_duplicates, unique_results, registry.near_duplicates
+    )
+
+    async def summarize(result: dict) -> str:
+        async with semaphore:
+            return await asummarize_webpage_content(result["raw_content"], query)
+
+    async def process(url: str, result: dict) -> str:
+        # Use existing content if no raw content for summarization
+        if not result.get("raw_content"):
+            return result["content"]
+        # A copy of a page seen earlier in the run shares its summary
+        key = result.get("duplicate_of", url)
+        return await registry.get_or_summarize(key, lambda: summarize(result))
+
+    contents = await asyncio.gather(
+        *(process(url, result) for url, result in unique_results.items())
+    )
+
+    return {
+        url: _summarized(result, content)
+        for (url, result), content in zip(unique_results.items(), contents)
+    }
+
+
+def _summarized(result: dict, content: str) -> dict:
+    summarized = {
+        "url": result["url"],
+        "title": result["title"],
+        "content": content,
+    }
+    if result.get("duplicate_urls"):
+        summarized["duplicate_urls"] = result["duplicate_urls"]
+    return summarized
+
+
 def format_search_output(summarized_results: dict) -> str:
     """Format search results into a well-structured string output."""
     if not summarized_results:
@@ -40,14 +160,14 @@ def format_search_output(summarized_results: dict) -> str:
 
     formatted_output = "Search results: \n\n"
 
-    for i, (url, result) in enumerate(summarized_results.items(), 1):
+    for i, result in enumerate(summarized_results.values(), 1):
         formatted_output += f"\n\n--- SOURCE {i}: {result['title']} ---\n"
-        formatted_output += f"URL: {url}\n\n"
+        formatted_output += f"URL: {result['url']}\n\n"
+        if result.get("duplicate_urls"):
+            formatted_output += (
+                f"ALSO PUBLISHED AT: {', '.join(result['duplicate_urls'])}\n\n"
+            )
         formatted_output += f"SUMMARY:\n{result['content']}\n\n"
         formatted_output += "-" * 80 + "\n"
 
     return formatted_output
-
-
-def perplexity_deduplicate_search_result():
-    pass 
\ No newline at end of file
@@ -0,0 +1,97 @@
+import logging
+import re
+import threading
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from deepresearch.config.env import NEAR_DUPLICATE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Pages shorter than this are snippets, too short to compare reliably
+MIN_WORDS = 50
+SHINGLE_WORDS = 5
+NUM_PERMUTATIONS = 64
+# Shingles hashed per step, bounds the temporary (chunk x permutations) array
+CHUNK_SIZE = 4096
+
+_WORD = re.compile(r"\w+")
+_FNV_PRIME = np.uint64(1099511628211)
+
+# Fixed seed so signatures are comparable across calls and processes
+_rng = np.random.default_rng(20250101)
+_PERMUTATION_A = _rng.integers(1, 2**63, NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_PERMUTATION_B = _rng.integers(0, 2**63, NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """MinHash signature of the word 5-shingles of a text, None for short texts.
+
+    The share of equal positions in two signatures estimates the Jaccard
+    similarity of the two texts' shingle sets.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < MIN_WORDS:
+        return None
+
+    word_hashes = np.fromiter(
+        (zlib.crc32(word.encode()) for word in words), dtype=np.uint64, count=len(words)
+    )
+    n_shingles = len(words) - SHINGLE_WORDS + 1
+    shingles = np.zeros(n_shingles, dtype=np.uint64)
+    for offset in range(SHINGLE_WORDS):
+        # Arithmetic wraps modulo 2**64
+        shingles = shingles * _FNV_PRIME + word_hashes[offset : offset + n_shingles]
+    shingles = np.unique(shingles)
+
+    signature = np.full(NUM_PERMUTATIONS, np.iinfo(np.uint64).max, dtype=np.uint64)
+    for start in range(0, len(shingles), CHUNK_SIZE):
+        chunk = shingles[start : start + CHUNK_SIZE, None]
+        hashed = chunk * _PERMUTATION_A + _PERMUTATION_B
+        np.minimum(signature, hashed.min(axis=0), out=signature)
+    return signature
+
+
+class NearDuplicateIndex:
+    """MinHash signatures of pages, to recognise copies published under other URLs.
+
+    Syndicated articles, mirrors and press releases share most of their text.
+    A page whose estimated similarity to an indexed page reaches ``threshold``
+    is reported as a copy of it.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.threshold = threshold
+        self.dropped = 0
+        self.merged = 0
+        self._keys: List[str] = []
+        self._signatures = np.empty((0, NUM_PERMUTATIONS), dtype=np.uint64)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def find(self, signature: Optional[np.ndarray]) -> Optional[str]:
+        """Key of the most similar indexed page above the threshold"""
+        if signature is None:
+            return None
+        with self._lock:
+            if not self._keys:
+                return None
+            similarity = (self._signatures == signature).mean(axis=1)
+            best = int(similarity.argmax())
+            if similarity[best] >= self.threshold:
+                return self._keys[best]
+        return None
+
+    def add(self, key: str, signature: Optional[np.ndarray]) -> None:
+        if signature is None:
+            return
+        with self._lock:
+            self._keys.append(key)
+            self._signatures = np.vstack([self._signatures, signature])
+
+    def stats(self) -> dict:
+        return {"pages": len(self), "dropped": self.dropped, "merged": self.merged}
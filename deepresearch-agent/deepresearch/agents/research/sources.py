@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from deepresearch.agents.research.near_duplicates import NearDuplicateIndex
+
+logger = logging.getLogger(__name__)
+
+# Registries kept for the most recent runs
+MAX_RUN_REGISTRIES = 64
+
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "yclid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+    "_gl",
+    "ref_src",
+    "spm",
+}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so that trivially different links to a page compare equal.
+
+    The scheme is unified to https, the host lowercased, default ports,
+    fragments, tracking parameters and trailing slashes dropped, and the
+    remaining query parameters sorted. The result is only a key for comparing
+    pages; sources are cited by the URL the search provider returned.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        return url
+
+    host = (parts.hostname or "").lower()
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS
+            and not key.lower().startswith("utm_")
+        )
+    )
+    path = parts.path.rstrip("/")
+
+    return urlunsplit(("https", host, path, query, ""))
+
+
+class SourceRegistry:
+    """Summaries of the pages seen during one research run.
+
+    Researchers running in parallel often find the same pages. The registry
+    keys pages by canonical URL and runs at most one summarization per page:
+    concurrent requests for a page wait on the in-flight task and share its
+    result, later requests get the stored summary. Its near-duplicate index
+    lets copies of a page under other URLs share the page's summary too.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.near_duplicates = NearDuplicateIndex()
+        self._summaries: Dict[str, str] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    async def get_or_summarize(
+        self, url: str, summarize: Callable[[], Awaitable[str]]
+    ) -> str:
+        key = canonicalize_url(url)
+        if key in self._summaries:
+            self.hits += 1
+            return self._summaries[key]
+
+        task = self._in_flight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(summarize())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+
+        # A waiter being cancelled must not cancel the summary others wait on
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "sources": len(self._summaries),
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "near_duplicates": self.near_duplicates.stats(),
+        }
+
+    def _store(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Failed summaries are not kept so a later request can retry
+        if not task.cancelled() and task.exception() is None:
+            self._summaries[key] = task.result()
+
+
+_registries: OrderedDict[str, SourceRegistry] = OrderedDict()
+_registries_lock = threading.Lock()
+
+
+def get_source_registry(run_id: Optional[str]) -> SourceRegistry:
+    """Return the source registry of a run, or a fresh one if the run is unknown"""
+    if not run_id:
+        return SourceRegistry()
+
+    with _registries_lock:
+        registry = _registries.get(run_id)
+        if registry is None:
+            registry = _registries[run_id] = SourceRegistry()
+        _registries.move_to_end(run_id)
+        while len(_registries) > MAX_RUN_REGISTRIES:
+            _registries.popitem(last=False)
+        return registry
@@ -1,7 +1,16 @@
+import asyncio
+from typing import Optional
+
 from langchain_core.messages import HumanMessage
 
+from deepresearch.agents.research.extraction import extract_relevant_content
+from deepresearch.agents.research.summary_cache import (
+    get_summary_cache,
+    summary_cache_key,
+)
+from deepresearch.config.env import EXTRACTION_ENABLED, SUMMARY_CACHE_ENABLED
 from deepresearch.config.llm import LlmService
-from deepresearch.core.constants import OpikPrompts
+from deepresearch.core.constants import ModelRole, OpikPrompts
 from deepresearch.core.model import Summary
 from deepresearch.core.opik_prompts import Opik_prompts
 from deepresearch.tools.utils import get_today_str
@@ -10,29 +19,104 @@ import logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-summarization_model = LlmService.get_model()
 
+def _build_summary_messages(webpage_content: str) -> list[HumanMessage]:
+    prompt = Opik_prompts.get_prompt(prompt_name=OpikPrompts.SUMMARIZE_WEBPAGE_PROMPT)
+    template = prompt.format(webpage_content=webpage_content, date=get_today_str())
+    return [HumanMessage(content=template)]
+
+
+def _format_summary(summary: Summary) -> str:
+    return (
+        f"<summary>\n{summary.summary}\n</summary>\n\n"
+        f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
+    )
+
+
+def _cache_key(webpage_content: str) -> str:
+    prompt_version = Opik_prompts.get_prompt_version(
+        OpikPrompts.SUMMARIZE_WEBPAGE_PROMPT
+    )
+    return summary_cache_key(webpage_content, prompt_version)
+
+
+def _prepare_content(webpage_content: str, query: Optional[str]) -> str:
+    """Keep only the parts of a page relevant to the query before summarizing"""
+    if not query or not EXTRACTION_ENABLED:
+        return webpage_content
+    return extract_relevant_content(webpage_content, query)
+
+
+def _truncate_content(webpage_content: str) -> str:
+    """Fallback used when summarization fails"""
+    return (
+        webpage_content[:1000] + "..."
+        if len(webpage_content) > 1000
+        else webpage_content
+    )
+
+
+def summarize_webpage_content(
+    webpage_content: str, query: Optional[str] = None
+) -> str:
+    """Summarize the webpage content.
 
-def summarize_webpage_content(webpage_content: str) -> str:
-    """Summarize the webpage content"""
+    With a query, the page is first reduced to the passages relevant to it.
+    Summaries are cached by the content actually summarized: a page that fits
+    the extraction budget is shared by every query that finds it, while a
+    trimmed page is only reused for queries that select the same passages.
+    """
 
+    cache_key = None
+    content = webpage_content
     try:
-        structured_model = summarization_model.with_structured_output(Summary)
-        prompt = Opik_prompts.get_prompt(
-            prompt_name=OpikPrompts.SUMMARIZE_WEBPAGE_PROMPT
-        )
-        template = prompt.format(webpage_content=webpage_content, date=get_today_str())
-
-        summary = structured_model.invoke([HumanMessage(content=template)])
-        formatted_summary = (
-            f"<summary>\n{summary.summary}\n</summary>\n\n"
-            f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
-        )
-        return formatted_summary
+        content = _prepare_content(webpage_content, query)
+        if SUMMARY_CACHE_ENABLED:
+            cache_key = _cache_key(content)
+            cached_summary = get_summary_cache().get(cache_key)
+            if cached_summary is not None:
+                return cached_summary
+
+        structured_model = LlmService.get_model(
+            ModelRole.SUMMARIZER
+        ).with_structured_output(Summary)
+        summary = structured_model.invoke(_build_summary_messages(content))
+        formatted_summary = _format_summary(summary)
+    except Exception as e:
+        print(f"Failed to summarize webpage: {str(e)}")
+        return _truncate_content(content)
+
+    if cache_key is not None:
+        get_summary_cache().set(cache_key, formatted_summary)
+    return formatted_summary
+
+
+async def asummarize_webpage_content(
+    webpage_content: str, query: Optional[str] = None
+) -> str:
+    """Summarize the webpage content without blocking the event loop"""
+
+    cache_key = None
+    content = webpage_content
+    try:
+        # Extraction is CPU-bound, keep it off the event loop
+        content = await asyncio.to_thread(_prepare_content, webpage_content, query)
+        if SUMMARY_CACHE_ENABLED:
+            # Resolving the prompt version may fetch the prompt
+            cache_key = await asyncio.to_thread(_cache_key, content)
+            cached_summary = await get_summary_cache().aget(cache_key)
+            if cached_summary is not None:
+                return cached_summary
+
+        structured_model = LlmService.get_model(
+            ModelRole.SUMMARIZER
+        ).with_structured_output(Summary)
+        summary = await structured_model.ainvoke(_build_summary_messages(content))
+        formatted_summary = _format_summary(summary)
     except Exception as e:
         print(f"Failed to summarize webpage: {str(e)}")
-        return (
-            webpage_content[:1000] + "..."
-            if len(webpage_content) > 1000
-            else webpage_content
-        )
+        return _truncate_content(content)
+
+    if cache_key is not None:
+        await get_summary_cache().aset(cache_key, formatted_summary)
+    return formatted_summary
@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from deepresearch.config.env import CACHE_DIR, SUMMARY_CACHE_MAX_MB
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def summary_cache_key(webpage_content: str, prompt_version: str) -> str:
+    """Content address of a page summary.
+
+    Whitespace is collapsed so that trivially re-rendered copies of the same
+    page share an entry, and the prompt version is part of the key so a new
+    summarization prompt never serves summaries written by the old one.
+    """
+    normalized = _WHITESPACE.sub(" ", webpage_content).strip()
+    digest = hashlib.sha256()
+    digest.update(prompt_version.encode())
+    digest.update(b"\0")
+    digest.update(normalized.encode())
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """SQLite-backed LRU cache of webpage summaries shared across runs.
+
+    Reads and writes go through one connection guarded by a lock, so the cache
+    is safe to use from worker threads; the async methods run the queries in a
+    thread so that many coroutines can use it without blocking the event loop.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, summary TEXT NOT NULL, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS summaries_last_access "
+            "ON summaries (last_access)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE summaries SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+            return row[0]
+
+    def set(self, key: str, summary: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries "
+                "(key, summary, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, summary, len(summary.encode()), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    async def aget(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, summary: str) -> None:
+        await asyncio.to_thread(self.set, key, summary)
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM summaries")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def _evict(self) -> None:
+        """Drop least recently used summaries until the cache fits max_bytes"""
+        (size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM summaries"
+        ).fetchone()
+        if size <= self.max_bytes:
+            return
+
+        freed = 0
+        stale_keys = []
+        for key, entry_size in self._conn.execute(
+            "SELECT key, size FROM summaries ORDER BY last_access"
+        ):
+            if size - freed <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            freed += entry_size
+
+        self._conn.executemany("DELETE FROM summaries WHERE key = ?", stale_keys)
+        logger.info(f"Evicted {len(stale_keys)} cached summaries ({freed} bytes)")
+
+
+_summary_cache: Optional[SummaryCache] = None
+_summary_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> SummaryCache:
+    """Return the process-wide summary cache, creating it on first use"""
+    global _summary_cache
+
+    with _summary_cache_lock:
+        if _summary_cache is None:
+            _summary_cache = SummaryCache(
+                Path(CACHE_DIR) / "summaries.sqlite3",
+                max_bytes=int(SUMMARY_CACHE_MAX_MB * 1024 * 1024),
+            )
+    return _summary_cache
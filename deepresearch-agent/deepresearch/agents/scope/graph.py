@@ -2,29 +2,26 @@ import logging
 
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, HumanMessage, get_buffer_string
-from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import StateGraph
 from langgraph.types import Command
 
 from deepresearch.config.llm import LlmService
-from deepresearch.core.constants import ConfigClass, GraphNode, OpikPrompts
+from deepresearch.core.constants import ConfigClass, GraphNode, ModelRole, OpikPrompts
 from deepresearch.core.constants import StartEvaluationOpikPrompt
 from deepresearch.core.model import ClarifyWithUser, ResearchQuestion
 from deepresearch.core.opik_prompts import Opik_prompts
 from deepresearch.core.state import AgentInputState, AgentState
 from deepresearch.tools.utils import get_today_str
 
-from deepresearch.config.gemini_models import GeminiModel
 load_dotenv()
 
-llm = LlmService.get_model()
-print(llm)
 logger = logging.getLogger(__name__)
 
 
 def clarify_with_user(state: AgentState) -> Command[GraphNode]:
     """Clarify with User"""
 
+    llm = LlmService.get_model(ModelRole.CLARIFIER)
     structured_model = llm.with_structured_output(ClarifyWithUser)
     template = Opik_prompts.get_prompt(
         prompt_name=OpikPrompts.CLARIFY_WITH_USER_INSTRUCTIONS
@@ -51,6 +48,7 @@ def clarify_with_user(state: AgentState) -> Command[GraphNode]:
 def write_research_brief(state: AgentState) -> AgentState:
     """writing the research brief"""
 
+    llm = LlmService.get_model(ModelRole.CLARIFIER)
     structured_output_model = llm.with_structured_output(ResearchQuestion)
     prompt = Opik_prompts.get_prompt(
         prompt_name=OpikPrompts.TRANSFORM_MESSAGES_INTO_RESEARCH_TOPIC_PROMPT,
@@ -70,7 +68,6 @@ def write_research_brief(state: AgentState) -> AgentState:
 
 
 scope_builder = StateGraph(AgentState, input_schema=AgentInputState)
-checkpointer = InMemorySaver()
 
 scope_builder.add_node(GraphNode.CLARIFY_WITH_USER, clarify_with_user)
 scope_builder.add_node(GraphNode.WRITE_RESEARCH_BRIEF, write_research_brief)
@@ -78,4 +75,6 @@ scope_builder.add_node(GraphNode.WRITE_RESEARCH_BRIEF, write_research_brief)
 scope_builder.add_edge(GraphNode.START, GraphNode.CLARIFY_WITH_USER)
 scope_builder.add_edge(GraphNode.WRITE_RESEARCH_BRIEF, GraphNode.END)
 
-scope_graph = scope_builder.compile(checkpointer=checkpointer)
+# No checkpointer: the LangGraph server, or the caller compiling
+# scope_builder, provides its own persistence
+scope_graph = scope_builder.compile()
@@ -1,6 +1,9 @@
 import asyncio
-from typing import Literal
+import logging
+import random
+from typing import Literal, Optional
 
+from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
@@ -12,15 +15,31 @@ from langgraph.graph import StateGraph
 from langgraph.types import Command
 
 from deepresearch.agents.research.graph import research_agent
+from deepresearch.config.env import RESEARCH_UNIT_BACKOFF, RESEARCH_UNIT_RETRIES
 from deepresearch.config.llm import LlmService
-from deepresearch.core.constants import ConfigClass, GraphNode, OpikPrompts
+from deepresearch.config.metrics import count_run_event
+from deepresearch.core.constants import (
+    ConfigClass,
+    GraphNode,
+    ModelRole,
+    OpikPrompts,
+    StreamEvent,
+)
+from deepresearch.core.deadline import current_deadline
 from deepresearch.core.opik_prompts import Opik_prompts
 from deepresearch.core.state import SupervisorState
 from deepresearch.tools.tool import ConductResearch, ResearchComplete, think_tool
 from deepresearch.tools.utils import get_today_str
 
+logger = logging.getLogger(__name__)
+
+RESEARCH_CANCELLED = (
+    "Research cancelled: the run deadline was reached before this unit finished."
+)
+RESEARCH_FAILED = "Research failed after {attempts} attempts: {error}"
+# Key marking a research unit result that carries no findings
+RESEARCH_ERROR = "error"
 
-from deepresearch.config.gemini_models import GeminiModel
 
 def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     """
@@ -29,21 +48,90 @@ def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     sub-agents via ConductResearch tool calls, each sub-agent returns its
     compressed findings as the content of a ToolMessage. This function
     extracts all such ToolMessage content to compile the final research notes.
+    Failed and cancelled research units carry no findings and are skipped.
     """
 
     return [
-        tool_msg.content for tool_msg in filter_messages(messages, include_types="tool")
+        tool_msg.content
+        for tool_msg in filter_messages(messages, include_types="tool")
+        if tool_msg.status != "error"
     ]
 
 
 supervisor_tool = [think_tool, ConductResearch, ResearchComplete]
-supervisor_model = LlmService.get_model()
-supervisor_model_with_tools = supervisor_model.bind_tools(tools=supervisor_tool)
 
 max_researcher_iteration = 6
 max_concurrent_researcher = 3
 
 
+def _research_wait_timeout() -> Optional[float]:
+    """How long to wait for research units, None without a run deadline.
+
+    Units wrap up on their own at the deadline; half of the wrap-up time is
+    left for compressing their findings, the rest for the final report.
+    """
+    deadline = current_deadline()
+    if deadline is None or deadline.remaining() is None:
+        return None
+    return deadline.remaining() + deadline.wrap_up / 2
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, kept within the run deadline"""
+    delay = RESEARCH_UNIT_BACKOFF * 2**attempt * random.uniform(0.5, 1.5)
+    deadline = current_deadline()
+    if deadline is not None and deadline.remaining() is not None:
+        delay = min(delay, deadline.remaining())
+    return delay
+
+
+async def run_research_unit(tool_call, research_slots: asyncio.Semaphore) -> dict:
+    """Run one research sub-graph, retrying failures with backoff.
+
+    A unit that still fails after RESEARCH_UNIT_RETRIES retries returns an
+    error result instead of raising, so that it cannot take the other units of
+    the round down with it.
+    """
+    research_topic = tool_call["args"]["research_topic"]
+    research_event = {"id": tool_call["id"], "research_topic": research_topic}
+    await adispatch_custom_event(StreamEvent.RESEARCH_START, research_event)
+
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            # The slot is given up while waiting to retry
+            async with research_slots:
+                result = await research_agent.ainvoke(
+                    {
+                        ConfigClass.RESEARCHER_MESSAGES: [
+                            HumanMessage(content=research_topic)
+                        ],
+                        ConfigClass.RESEARCH_TOPIC: research_topic,
+                    }
+                )
+            await adispatch_custom_event(StreamEvent.RESEARCH_END, research_event)
+            return result
+        except Exception as e:
+            deadline = current_deadline()
+            out_of_time = deadline is not None and deadline.expired
+            logger.warning(
+                f"Research unit failed (attempt {attempts}): {research_topic[:80]}: {e!r}"
+            )
+            if attempts > RESEARCH_UNIT_RETRIES or out_of_time:
+                count_run_event("research_unit_failures")
+                error = RESEARCH_FAILED.format(attempts=attempts, error=repr(e))
+                await adispatch_custom_event(
+                    StreamEvent.RESEARCH_END, {**research_event, RESEARCH_ERROR: error}
+                )
+                return {
+                    GraphNode.COMPRESSED_RESEARCH_GRAPH: error,
+                    RESEARCH_ERROR: error,
+                }
+            count_run_event("research_unit_retries")
+            await asyncio.sleep(_retry_delay(attempts - 1))
+
+
 async def supervisor(
     state: SupervisorState,
 ) -> Command[Literal[GraphNode.SUPERVISOR_TOOLS]]:
@@ -58,7 +146,8 @@ async def supervisor(
         max_researcher_iterations=max_researcher_iteration,
     )
     messages = [SystemMessage(content=system_messages)] + supervisor_messages
-    response = await supervisor_model_with_tools.ainvoke(messages)
+    supervisor_model = LlmService.get_model(ModelRole.SUPERVISOR, tools=supervisor_tool)
+    response = await supervisor_model.ainvoke(messages)
 
     return Command(
         goto=GraphNode.SUPERVISOR_TOOLS,
@@ -88,7 +177,15 @@ async def supervisor_tools(
          keeps code simple and execution order predictable.
     
     2. **conduct_research (Concurrent Execution)**:
-       - Processed using asyncio.gather() for parallel execution
+       - Each call runs as a task through run_research_unit; a semaphore lets at
+         most max_concurrent_researcher units run at once, the others wait for a
+         free slot
+       - A failed unit is retried with backoff up to RESEARCH_UNIT_RETRIES times,
+         then reports an error result instead of raising, so the other units of
+         the round keep their findings
+       - The units are awaited with asyncio.wait, bounded by the run deadline;
+         units still pending at the timeout are cancelled and answered as
+         cancelled, and the research ends after the round
        - Rationale: Each conduct_research call spawns an independent research_agent
          sub-graph that performs multiple web searches, LLM calls, and data processing.
          These are I/O-bound operations that can take several seconds to minutes.
@@ -116,16 +213,20 @@ async def supervisor_tools(
     next_step = GraphNode.SUPERVISOR
     should_end = False
 
+    deadline = current_deadline()
     exceed_iteration = research_iteration >= max_researcher_iteration
     no_tool_calls = not most_recent_message.tool_calls
     research_complete = any(
         tool_call["name"] == GraphNode.RESEARCH_COMPLETE
         for tool_call in most_recent_message.tool_calls
     )
+    deadline_reached = deadline is not None and deadline.expired
 
-    if exceed_iteration or no_tool_calls or research_complete:
+    if exceed_iteration or no_tool_calls or research_complete or deadline_reached:
         should_end = True
         next_step = GraphNode.END
+        if deadline_reached and not (no_tool_calls or research_complete):
+            deadline.stopped_early = True
 
     else:
         try:
@@ -157,30 +258,45 @@ async def supervisor_tools(
                     )
                 )
 
-            # Process conduct_research calls concurrently (asyncio.gather)
-            # Why asyncio.gather? Each conduct_research call invokes a full research
+            # Process conduct_research calls concurrently (asyncio.wait)
+            # Why concurrently? Each conduct_research call invokes a full research
             # agent sub-graph that performs multiple web searches, LLM inference calls,
             # and content processing - operations that can take 10-60+ seconds each.
             # These are I/O-bound operations where threads/coroutines spend most time
             # waiting for external responses. Running them concurrently provides
             # massive performance gains (e.g., 3 tasks in 30s vs 90s sequentially).
             if conduct_research_calls:
-                coros = [
-                    research_agent.ainvoke(
-                        {
-                            ConfigClass.SUPERVISOR_MESSAGES: [
-                                HumanMessage(
-                                    content=tool_call["args"]["research_topic"]
-                                )
-                            ],
-                            ConfigClass.RESEARCH_TOPIC: tool_call["args"][
-                                "research_topic"
-                            ],
-                        }
-                    )
+                # Calls beyond max_concurrent_researcher wait for a free slot
+                research_slots = asyncio.Semaphore(max_concurrent_researcher)
+                count_run_event("research_units", len(conduct_research_calls))
+
+                # Units fail independently, see run_research_unit
+                tasks = [
+                    asyncio.ensure_future(run_research_unit(tool_call, research_slots))
                     for tool_call in conduct_research_calls
                 ]
-                tool_results = await asyncio.gather(*coros)
+                # Units still running past the run deadline are cancelled,
+                # together with their searches and LLM calls
+                _, pending = await asyncio.wait(
+                    tasks, timeout=_research_wait_timeout()
+                )
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    deadline.stopped_early = True
+                    logger.warning(
+                        f"Cancelled {len(pending)} research units at the run deadline"
+                    )
+                tool_results = [
+                    {
+                        GraphNode.COMPRESSED_RESEARCH_GRAPH: RESEARCH_CANCELLED,
+                        RESEARCH_ERROR: RESEARCH_CANCELLED,
+                    }
+                    if task in pending
+                    else task.result()
+                    for task in tasks
+                ]
 
                 research_tool_messages = [
                     ToolMessage(
@@ -190,17 +306,28 @@ async def supervisor_tools(
                         ),
                         name=tool_call["name"],
                         tool_call_id=tool_call["id"],
+                        status="error" if RESEARCH_ERROR in result else "success",
                     )
                     for result, tool_call in zip(tool_results, conduct_research_calls)
                 ]
 
                 tool_messages.extend(research_tool_messages)
 
+                # Completed units keep their notes whatever happened to the others
                 all_raw_notes = [
-                    "\n".join(result.get("raw_notes", [])) for result in tool_results
+                    "\n".join(result.get("raw_notes", []))
+                    for result in tool_results
+                    if RESEARCH_ERROR not in result
                 ]
 
+                # No time left for another supervisor round
+                if deadline is not None and deadline.expired:
+                    deadline.stopped_early = True
+                    should_end = True
+                    next_step = GraphNode.END
+
         except Exception:
+            logger.exception("Supervisor tools failed, ending research")
             should_end = True
             next_step = GraphNode.END
 
@@ -208,8 +335,11 @@ async def supervisor_tools(
         return Command(
             goto=next_step,
             update={
-                ConfigClass.NOTES: get_notes_from_tool_calls(supervisor_messages),
+                ConfigClass.NOTES: get_notes_from_tool_calls(
+                    list(supervisor_messages) + tool_messages
+                ),
                 ConfigClass.RESEARCH_BRIEF: state.get(ConfigClass.RESEARCH_BRIEF, ""),
+                ConfigClass.RAW_NOTES: all_raw_notes,
             },
         )
     else:
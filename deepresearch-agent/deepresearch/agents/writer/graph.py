@@ -1,23 +1,168 @@
+import asyncio
+import logging
+import time
+from typing import List, Literal
+
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
+from langgraph.types import Command
 
+from deepresearch.agents.research.extraction import estimate_tokens
 from deepresearch.agents.scope.graph import clarify_with_user, write_research_brief
 from deepresearch.agents.supervisor.graph import supervisor_agent
+from deepresearch.agents.writer.research_cache import get_research_cache
+from deepresearch.config.env import (
+    REPORT_GROUP_TOKENS,
+    REPORT_MAP_REDUCE_THRESHOLD,
+    REPORT_MAX_CONCURRENCY,
+    REPORT_MAX_LEVELS,
+    RESEARCH_CACHE_ENABLED,
+    RESEARCH_CACHE_REUSE,
+)
 from deepresearch.config.llm import LlmService
-from deepresearch.core.constants import ConfigClass, GraphNode, OpikPrompts
+from deepresearch.config.metrics import count_run_event
+from deepresearch.core.constants import ConfigClass, GraphNode, ModelRole, OpikPrompts
+from deepresearch.core.deadline import current_deadline
 from deepresearch.core.opik_prompts import Opik_prompts
 from deepresearch.core.state import AgentInputState, AgentState
 from deepresearch.tools.utils import get_today_str
 
-from deepresearch.config.gemini_models import GeminiModel
+logger = logging.getLogger(__name__)
+
+
+def group_notes(notes: List[str], max_tokens: int = REPORT_GROUP_TOKENS) -> List[str]:
+    """Pack notes, in order, into groups of at most about ``max_tokens`` tokens"""
+    pieces: List[str] = []
+    for note in notes:
+        paragraphs = note.split("\n\n")
+        if estimate_tokens(note) <= max_tokens or len(paragraphs) == 1:
+            pieces.append(note)
+        else:
+            # Oversized notes are split on paragraph boundaries
+            pieces.extend(group_notes(paragraphs, max_tokens))
+
+    groups: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = estimate_tokens(piece)
+        if current and current_tokens + tokens > max_tokens:
+            groups.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        groups.append("\n\n".join(current))
+    return groups
+
+
+async def reuse_research(
+    state: AgentState, config: RunnableConfig
+) -> Command[
+    Literal[
+        GraphNode.SUPERVISOR_SUBGRAPH,
+        GraphNode.CONDENSE_FINDINGS,
+        GraphNode.FINAL_REPORT_GENERATION,
+        GraphNode.END,
+    ]
+]:
+    """Skip the research when a recent run of a matching brief can be reused"""
+    configurable = (config or {}).get(ConfigClass.CONFIGURABLE, {})
+    if not RESEARCH_CACHE_ENABLED or not configurable.get(
+        ConfigClass.REUSE_RESEARCH, True
+    ):
+        return Command(goto=GraphNode.SUPERVISOR_SUBGRAPH)
+
+    research_brief = state.get(ConfigClass.RESEARCH_BRIEF, "")
+    cached = await get_research_cache().aget(research_brief)
+    if cached is None:
+        return Command(goto=GraphNode.SUPERVISOR_SUBGRAPH)
+
+    logger.info(
+        f"Reusing research of a brief with similarity {cached.similarity:.2f}, "
+        f"stored {(time.time() - cached.created_at) / 3600:.1f}h ago"
+    )
+    count_run_event("research_reused")
+    if RESEARCH_CACHE_REUSE == "report":
+        return Command(
+            goto=GraphNode.END,
+            update={
+                ConfigClass.FINAL_REPORT: cached.final_report,
+                ConfigClass.MESSAGES: [
+                    "Here is the final report: " + cached.final_report
+                ],
+                ConfigClass.REUSED_RESEARCH: True,
+            },
+        )
+    return Command(
+        goto=should_condense({ConfigClass.NOTES: cached.notes}),
+        update={ConfigClass.NOTES: cached.notes, ConfigClass.REUSED_RESEARCH: True},
+    )
+
+
+def should_condense(state: AgentState) -> Literal[GraphNode]:
+    """Condense the findings first when they are too large for one report call"""
+    findings_tokens = estimate_tokens("\n".join(state.get(ConfigClass.NOTES, [])))
+    if findings_tokens > REPORT_MAP_REDUCE_THRESHOLD:
+        return GraphNode.CONDENSE_FINDINGS
+    return GraphNode.FINAL_REPORT_GENERATION
+
+
+async def condense_findings(state: AgentState):
+    """Map stage of the report: condense groups of notes in parallel.
+
+    Levels repeat on the condensed notes until they fit under
+    REPORT_MAP_REDUCE_THRESHOLD, or REPORT_MAX_LEVELS is reached.
+    """
+    prompt = Opik_prompts.get_prompt(prompt_name=OpikPrompts.CONDENSE_FINDINGS_PROMPT)
+    research_brief = state.get(ConfigClass.RESEARCH_BRIEF, "")
+    compress_model = LlmService.get_model(ModelRole.COMPRESSOR)
+    slots = asyncio.Semaphore(REPORT_MAX_CONCURRENCY)
+
+    async def condense(group: str) -> str:
+        async with slots:
+            response = await compress_model.ainvoke(
+                [
+                    HumanMessage(
+                        content=prompt.format(
+                            date=get_today_str(),
+                            research_brief=research_brief,
+                            findings=group,
+                        )
+                    )
+                ]
+            )
+        return str(response.content)
+
+    notes = list(state.get(ConfigClass.NOTES, []))
+    tokens = estimate_tokens("\n".join(notes))
+    for level in range(1, REPORT_MAX_LEVELS + 1):
+        previous_tokens = tokens
+        groups = group_notes(notes)
+        notes = await asyncio.gather(*(condense(group) for group in groups))
+        tokens = estimate_tokens("\n".join(notes))
+        logger.info(
+            f"Condensed findings level {level}: {len(groups)} groups, ~{tokens} tokens"
+        )
+        # Another level only helps while condensing still shrinks the notes
+        if (
+            tokens <= REPORT_MAP_REDUCE_THRESHOLD
+            or len(groups) == 1
+            or tokens >= previous_tokens
+        ):
+            break
 
-writer_model = LlmService.get_model()
+    return {ConfigClass.CONDENSED_NOTES: notes}
 
 
 async def final_report_generation(state: AgentState):
-    """Final report"""
+    """Final report, the reduce stage when the findings were condensed first.
 
-    notes = state.get(ConfigClass.NOTES, [])
+    Complete research is stored for reuse by later runs of a similar brief.
+    """
+
+    notes = state.get(ConfigClass.CONDENSED_NOTES) or state.get(ConfigClass.NOTES, [])
     findings = "\n".join(notes)
 
     final_report_generation_prompt = Opik_prompts.get_prompt(
@@ -30,34 +175,96 @@ async def final_report_generation(state: AgentState):
         date=get_today_str(),
     )
 
+    writer_model = LlmService.get_model(ModelRole.WRITER)
     final_report = await writer_model.ainvoke(
         [HumanMessage(content=final_report_prompt)]
     )
+    await _store_research(state, final_report.content)
     return {
         ConfigClass.FINAL_REPORT: final_report.content,
         ConfigClass.MESSAGES: ["Here is the final report: " + final_report.content],
     }
 
 
+async def _store_research(state: AgentState, final_report: str) -> None:
+    notes = state.get(ConfigClass.NOTES, [])
+    deadline = current_deadline()
+    # Reused or cut short research is not stored again
+    if (
+        not RESEARCH_CACHE_ENABLED
+        or not notes
+        or state.get(ConfigClass.REUSED_RESEARCH)
+        or (deadline is not None and deadline.stopped_early)
+    ):
+        return
+    try:
+        await get_research_cache().aset(
+            state.get(ConfigClass.RESEARCH_BRIEF, ""), notes, final_report
+        )
+    except Exception as e:
+        logger.warning(f"Failed to store research for reuse: {e}")
+
+
 deep_researcher_builder = StateGraph(AgentState, input_schema=AgentInputState)
 
 # Add workflow nodes
 deep_researcher_builder.add_node(GraphNode.CLARIFY_WITH_USER, clarify_with_user)
 deep_researcher_builder.add_node(GraphNode.WRITE_RESEARCH_BRIEF, write_research_brief)
+deep_researcher_builder.add_node(GraphNode.REUSE_RESEARCH, reuse_research)
 deep_researcher_builder.add_node(GraphNode.SUPERVISOR_SUBGRAPH, supervisor_agent)
+deep_researcher_builder.add_node(GraphNode.CONDENSE_FINDINGS, condense_findings)
 deep_researcher_builder.add_node(
     GraphNode.FINAL_REPORT_GENERATION, final_report_generation
 )
 
 # Add workflow edges
 deep_researcher_builder.add_edge(GraphNode.START, GraphNode.CLARIFY_WITH_USER)
-deep_researcher_builder.add_edge(
-    GraphNode.WRITE_RESEARCH_BRIEF, GraphNode.SUPERVISOR_SUBGRAPH
+deep_researcher_builder.add_edge(GraphNode.WRITE_RESEARCH_BRIEF, GraphNode.REUSE_RESEARCH)
+deep_researcher_builder.add_conditional_edges(
+    GraphNode.SUPERVISOR_SUBGRAPH,
+    should_condense,
+    {
+        GraphNode.CONDENSE_FINDINGS: GraphNode.CONDENSE_FINDINGS,
+        GraphNode.FINAL_REPORT_GENERATION: GraphNode.FINAL_REPORT_GENERATION,
+    },
 )
 deep_researcher_builder.add_edge(
-    GraphNode.SUPERVISOR_SUBGRAPH, GraphNode.FINAL_REPORT_GENERATION
+    GraphNode.CONDENSE_FINDINGS, GraphNode.FINAL_REPORT_GENERATION
 )
 deep_researcher_builder.add_edge(GraphNode.FINAL_REPORT_GENERATION, GraphNode.END)
 
 # Compile the full workflow
 agent = deep_researcher_builder.compile()
+
+
+def research_brief_input(research_brief: str) -> dict:
+    """Input of ``brief_agent``, the state ``write_research_brief`` would produce"""
+    return {
+        ConfigClass.RESEARCH_BRIEF: research_brief,
+        ConfigClass.SUPERVISOR_MESSAGES: [HumanMessage(content=f"{research_brief}.")],
+    }
+
+
+# Research and report for a brief written up front, without the scoping steps
+brief_agent_builder = StateGraph(AgentState)
+
+brief_agent_builder.add_node(GraphNode.REUSE_RESEARCH, reuse_research)
+brief_agent_builder.add_node(GraphNode.SUPERVISOR_SUBGRAPH, supervisor_agent)
+brief_agent_builder.add_node(GraphNode.CONDENSE_FINDINGS, condense_findings)
+brief_agent_builder.add_node(GraphNode.FINAL_REPORT_GENERATION, final_report_generation)
+
+brief_agent_builder.add_edge(GraphNode.START, GraphNode.REUSE_RESEARCH)
+brief_agent_builder.add_conditional_edges(
+    GraphNode.SUPERVISOR_SUBGRAPH,
+    should_condense,
+    {
+        GraphNode.CONDENSE_FINDINGS: GraphNode.CONDENSE_FINDINGS,
+        GraphNode.FINAL_REPORT_GENERATION: GraphNode.FINAL_REPORT_GENERATION,
+    },
+)
+brief_agent_builder.add_edge(
+    GraphNode.CONDENSE_FINDINGS, GraphNode.FINAL_REPORT_GENERATION
+)
+brief_agent_builder.add_edge(GraphNode.FINAL_REPORT_GENERATION, GraphNode.END)
+
+brief_agent = brief_agent_builder.compile()
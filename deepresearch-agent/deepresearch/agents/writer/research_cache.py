@@ -0,0 +1,193 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from deepresearch.config.env import (
+    CACHE_DIR,
+    RESEARCH_CACHE_MAX_ENTRIES,
+    RESEARCH_CACHE_SIMILARITY,
+    RESEARCH_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_brief(research_brief: str) -> str:
+    """Lowercase the brief and reduce it to its words, for exact matching"""
+    return _NON_WORD.sub(" ", research_brief.lower()).strip()
+
+
+def research_cache_key(research_brief: str) -> str:
+    return hashlib.sha256(normalize_brief(research_brief).encode()).hexdigest()
+
+
+class CachedResearch(NamedTuple):
+    research_brief: str
+    notes: List[str]
+    final_report: str
+    created_at: float
+    # 1.0 for an exact match of the normalized brief
+    similarity: float
+
+
+class ResearchCache:
+    """SQLite-backed cache of completed research, keyed by research brief.
+
+    A brief matches a stored run when their normalized text is equal or, failing
+    that, when the TF-IDF cosine similarity of the two briefs reaches
+    ``similarity``. Runs older than ``ttl`` seconds are never served.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = RESEARCH_CACHE_TTL,
+        similarity: float = RESEARCH_CACHE_SIMILARITY,
+        max_entries: int = RESEARCH_CACHE_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.similarity = similarity
+        self.max_entries = max_entries
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS research_runs ("
+            "key TEXT PRIMARY KEY, research_brief TEXT NOT NULL, "
+            "notes TEXT NOT NULL, final_report TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, research_brief: str) -> Optional[CachedResearch]:
+        """The freshest stored run matching the brief, exactly or by similarity"""
+        fresh_after = time.time() - self.ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT research_brief, notes, final_report, created_at "
+                "FROM research_runs WHERE key = ? AND created_at >= ?",
+                (research_cache_key(research_brief), fresh_after),
+            ).fetchone()
+            if row is not None:
+                self.hits += 1
+                return self._entry(row, 1.0)
+
+            rows = self._conn.execute(
+                "SELECT research_brief, notes, final_report, created_at "
+                "FROM research_runs WHERE created_at >= ?",
+                (fresh_after,),
+            ).fetchall()
+
+        best, similarity = self._most_similar(research_brief, rows)
+        if best is None or similarity < self.similarity:
+            self.misses += 1
+            return None
+        self.similar_hits += 1
+        return self._entry(best, similarity)
+
+    def set(self, research_brief: str, notes: List[str], final_report: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO research_runs "
+                "(key, research_brief, notes, final_report, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    research_cache_key(research_brief),
+                    research_brief,
+                    json.dumps(notes),
+                    final_report,
+                    time.time(),
+                ),
+            )
+            # Expired runs are never served, and only the newest are compared
+            self._conn.execute(
+                "DELETE FROM research_runs WHERE created_at < ? OR key IN ("
+                "SELECT key FROM research_runs ORDER BY created_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (time.time() - self.ttl, self.max_entries),
+            )
+            self._conn.commit()
+
+    async def aget(self, research_brief: str) -> Optional[CachedResearch]:
+        return await asyncio.to_thread(self.get, research_brief)
+
+    async def aset(
+        self, research_brief: str, notes: List[str], final_report: str
+    ) -> None:
+        await asyncio.to_thread(self.set, research_brief, notes, final_report)
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._conn.execute(
+                "SELECT COUNT(*) FROM research_runs"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "entries": entries,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM research_runs")
+            self._conn.commit()
+            self.hits = 0
+            self.similar_hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def _most_similar(research_brief: str, rows: list):
+        """The stored row whose brief is most similar to the brief, by TF-IDF cosine"""
+        if not rows:
+            return None, 0.0
+        # scikit-learn is slow to import and only needed once runs are stored
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        briefs = [row[0] for row in rows] + [research_brief]
+        vectorizer = TfidfVectorizer(stop_words="english", sublinear_tf=True)
+        try:
+            vectors = vectorizer.fit_transform(briefs)
+        except ValueError:
+            # Only stop words in the briefs
+            return None, 0.0
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        similarities = (vectors[:-1] @ vectors[-1].T).toarray().ravel()
+        best = int(similarities.argmax())
+        return rows[best], float(similarities[best])
+
+    @staticmethod
+    def _entry(row, similarity: float) -> CachedResearch:
+        research_brief, notes, final_report, created_at = row
+        return CachedResearch(
+            research_brief, json.loads(notes), final_report, created_at, similarity
+        )
+
+
+_research_cache: Optional[ResearchCache] = None
+_research_cache_lock = threading.Lock()
+
+
+def get_research_cache() -> ResearchCache:
+    """Return the process-wide research cache, creating it on first use"""
+    global _research_cache
+
+    with _research_cache_lock:
+        if _research_cache is None:
+            _research_cache = ResearchCache(Path(CACHE_DIR) / "research.sqlite3")
+    return _research_cache
@@ -12,15 +12,134 @@ GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
 # tools
 EXA_API_KEY = os.getenv("EXA_API_KEY")
 TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+TAVILY_API_URL = os.getenv("TAVILY_API_URL", "https://api.tavily.com")
+TAVILY_MAX_CONCURRENCY = int(os.getenv("TAVILY_MAX_CONCURRENCY", "5"))
+TAVILY_TIMEOUT = float(os.getenv("TAVILY_TIMEOUT", "60"))
+
+# search providers, in priority order, and how searches are routed to them:
+# "fallback" (next provider when one fails), "race" (first answer of the first
+# SEARCH_RACE_PROVIDERS providers wins) or "merge" (all providers, deduplicated)
+SEARCH_PROVIDERS = os.getenv("SEARCH_PROVIDERS", "tavily,perplexity")
+SEARCH_ROUTING = os.getenv("SEARCH_ROUTING", "fallback")
+SEARCH_RACE_PROVIDERS = int(os.getenv("SEARCH_RACE_PROVIDERS", "2"))
+
+# search cache: "memory", "sqlite" or "none"
+SEARCH_CACHE_BACKEND = os.getenv("SEARCH_CACHE_BACKEND", "memory")
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+SEARCH_CACHE_TTL_GENERAL = float(os.getenv("SEARCH_CACHE_TTL_GENERAL", "86400"))
+SEARCH_CACHE_TTL_NEWS = float(os.getenv("SEARCH_CACHE_TTL_NEWS", "900"))
+SEARCH_CACHE_TTL_FINANCE = float(os.getenv("SEARCH_CACHE_TTL_FINANCE", "3600"))
+SEARCH_CACHE_STALE_WHILE_REVALIDATE = (
+    os.getenv("SEARCH_CACHE_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+)
+# How long past its TTL a stale entry may still be served while revalidating
+SEARCH_CACHE_STALE_TTL = float(os.getenv("SEARCH_CACHE_STALE_TTL", "86400"))
+
+# summarization
+SUMMARIZATION_MAX_CONCURRENCY = int(os.getenv("SUMMARIZATION_MAX_CONCURRENCY", "5"))
+SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+SUMMARY_CACHE_MAX_MB = float(os.getenv("SUMMARY_CACHE_MAX_MB", "256"))
+
+# query-aware extraction of page content before summarization
+EXTRACTION_ENABLED = os.getenv("EXTRACTION_ENABLED", "true").lower() == "true"
+EXTRACTION_TOKEN_BUDGET = int(os.getenv("EXTRACTION_TOKEN_BUDGET", "2000"))
+EXTRACTION_PASSAGE_WORDS = int(os.getenv("EXTRACTION_PASSAGE_WORDS", "120"))
+
+# near-duplicate pages (mirrors, syndicated copies) are summarized only once
+NEAR_DUPLICATE_ENABLED = os.getenv("NEAR_DUPLICATE_ENABLED", "true").lower() == "true"
+# Estimated Jaccard similarity of the pages' word shingles
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.7"))
+
+# rolling compaction of the researcher context
+RESEARCH_COMPACTION_ENABLED = (
+    os.getenv("RESEARCH_COMPACTION_ENABLED", "true").lower() == "true"
+)
+# Approximate tokens of un-digested history that trigger a compaction
+RESEARCH_COMPACTION_THRESHOLD = int(os.getenv("RESEARCH_COMPACTION_THRESHOLD", "12000"))
+# Most recent tool rounds kept verbatim after a compaction
+RESEARCH_COMPACTION_KEEP_ROUNDS = int(os.getenv("RESEARCH_COMPACTION_KEEP_ROUNDS", "1"))
+
+# hard budgets per research unit, overridable per request; 0 disables a limit.
+# Tool calls count searches only, not think_tool reflections
+RESEARCHER_MAX_TOOL_CALLS = int(os.getenv("RESEARCHER_MAX_TOOL_CALLS", "12"))
+# Tokens of the researcher's own LLM calls, including context compaction
+RESEARCHER_MAX_TOKENS = int(os.getenv("RESEARCHER_MAX_TOKENS", "150000"))
+RESEARCHER_TIMEOUT = float(os.getenv("RESEARCHER_TIMEOUT", "300"))
+
+# hierarchical (map-reduce) synthesis of the final report for large findings
+REPORT_MAP_REDUCE_THRESHOLD = int(os.getenv("REPORT_MAP_REDUCE_THRESHOLD", "30000"))
+# Approximate tokens of findings condensed by one call
+REPORT_GROUP_TOKENS = int(os.getenv("REPORT_GROUP_TOKENS", "12000"))
+REPORT_MAX_LEVELS = int(os.getenv("REPORT_MAX_LEVELS", "3"))
+REPORT_MAX_CONCURRENCY = int(os.getenv("REPORT_MAX_CONCURRENCY", "4"))
+
+# completed research reused for later runs of a matching research brief
+RESEARCH_CACHE_ENABLED = os.getenv("RESEARCH_CACHE_ENABLED", "true").lower() == "true"
+# "notes": write a new report from the stored notes, "report": return the stored report
+RESEARCH_CACHE_REUSE = os.getenv("RESEARCH_CACHE_REUSE", "notes")
+RESEARCH_CACHE_TTL = float(os.getenv("RESEARCH_CACHE_TTL", "604800"))
+# TF-IDF cosine similarity of two briefs from which research is reused
+RESEARCH_CACHE_SIMILARITY = float(os.getenv("RESEARCH_CACHE_SIMILARITY", "0.8"))
+RESEARCH_CACHE_MAX_ENTRIES = int(os.getenv("RESEARCH_CACHE_MAX_ENTRIES", "500"))
+
+# research units that raise are retried with exponential backoff
+RESEARCH_UNIT_RETRIES = int(os.getenv("RESEARCH_UNIT_RETRIES", "2"))
+RESEARCH_UNIT_BACKOFF = float(os.getenv("RESEARCH_UNIT_BACKOFF", "2"))
+
+# request-scoped deadline of a whole agent run, overridable per request
+RUN_TIMEOUT = float(os.getenv("RUN_TIMEOUT", "900"))
+# Time allowed past the deadline to compress findings and write a partial report
+RUN_WRAP_UP_SECONDS = float(os.getenv("RUN_WRAP_UP_SECONDS", "90"))
 
 # tracing
 OPIK_API_KEY = os.getenv("OPIK_API_KEY")
 
+# prompts
+PROMPT_CACHE_TTL = float(os.getenv("PROMPT_CACHE_TTL", "300"))
+# Comma separated "<prompt_name>=<commit>" pairs pinning prompts to a version
+PROMPT_VERSIONS = os.getenv("PROMPT_VERSIONS", "")
+
+# background research jobs
+RESEARCH_WORKERS = int(os.getenv("RESEARCH_WORKERS", "2"))
+RESEARCH_QUEUE_SIZE = int(os.getenv("RESEARCH_QUEUE_SIZE", "20"))
+
+# offline batches of research briefs, see deepresearch.interface.batch
+BATCH_WORKERS = int(os.getenv("BATCH_WORKERS", "4"))
+
+# local caches
+CACHE_DIR = os.getenv("DEEPRESEARCH_CACHE_DIR", ".cache")
+
+# checkpoints and chat threads
+CHECKPOINT_DB_PATH = os.getenv(
+    "CHECKPOINT_DB_PATH", os.path.join(CACHE_DIR, "checkpoints.sqlite3")
+)
+FINISHED_THREAD_TTL = float(os.getenv("FINISHED_THREAD_TTL", "86400"))
+ACTIVE_THREAD_TTL = float(os.getenv("ACTIVE_THREAD_TTL", "604800"))
+MAX_FINISHED_THREADS = int(os.getenv("MAX_FINISHED_THREADS", "1000"))
+CHECKPOINT_MAX_MB = float(os.getenv("CHECKPOINT_MAX_MB", "1024"))
+THREAD_PRUNE_INTERVAL = float(os.getenv("THREAD_PRUNE_INTERVAL", "300"))
+
 
 LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")
 
+# Model settings per role (clarifier, supervisor, researcher, summarizer,
+# compressor, writer) default to the table in config/llm.py. LLM_MODEL,
+# LLM_TEMPERATURE, LLM_MAX_TOKENS and LLM_TIMEOUT override every role, and a
+# role suffix overrides a single one, e.g. LLM_MODEL_WRITER=gpt-4.1.
+# LLM_MAX_TOKENS=0 keeps the provider's output limit.
+
+# Shared LLM budgets per provider. Override for a single provider with a suffix,
+# e.g. LLM_REQUESTS_PER_MINUTE_OPENAI. 0 disables a limit.
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "8"))
+
 
 PPLX_API_KEY = os.getenv("PPLX_API_KEY")
 PPLX_API_URL = os.getenv("PPLX_API_URL", "https://api.perplexity.ai")
 PPLX_MODEL = os.getenv("PPLX_MODEL", "sonar")
 PPLX_INSIGHTS_MODEL = os.getenv("PPLX_INSIGHTS_MODEL", "sonar-pro")
+PPLX_MAX_CONCURRENCY = int(os.getenv("PPLX_MAX_CONCURRENCY", "5"))
+PPLX_TIMEOUT = float(os.getenv("PPLX_TIMEOUT", "60"))
+# Page content returned per result, used in place of raw page content
+PPLX_MAX_TOKENS_PER_PAGE = int(os.getenv("PPLX_MAX_TOKENS_PER_PAGE", "2048"))
@@ -0,0 +1,238 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from deepresearch.config.env import (
+    LLM_MAX_IN_FLIGHT,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+)
+
+WINDOW_SECONDS = 60.0
+
+
+def _provider_limit(name: str, provider: str, default: int) -> int:
+    return int(os.getenv(f"{name}_{provider.upper()}", default))
+
+
+class LlmGovernor(BaseRateLimiter):
+    """Shared per-provider limiter for every chat model call.
+
+    Callers wait in FIFO order until the provider is under its request-per-
+    minute budget, its token-per-minute budget (tokens actually used in the
+    last minute) and its max-in-flight limit. Models take a slot through the
+    ``rate_limiter`` hook. An async call's slot is leased to the asyncio task
+    that acquired it and returned when that task finishes, so cancelled calls
+    cannot leak slots. A sync call's slot is returned when the call ends or
+    fails.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_in_flight: int,
+        check_every_n_seconds: float = 0.05,
+    ):
+        self.provider = provider
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_in_flight = max_in_flight
+        self.check_every_n_seconds = check_every_n_seconds
+        self.callback_handler = GovernorCallbackHandler(self)
+
+        self._lock = threading.Lock()
+        self._waiting: deque = deque()
+        self._request_times: deque = deque()
+        self._token_usage: deque = deque()
+        self._tokens_in_window = 0
+        self._in_flight = 0
+        self._task_slots: Dict[asyncio.Task, int] = {}
+        self._thread_slots: Dict[int, int] = {}
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        # Sleeping on the event loop thread would stall the async callers
+        # ahead in line, which can only release their slots on that loop
+        on_event_loop = _running_loop() is not None
+        ticket = object()
+        with self._lock:
+            self._waiting.append(ticket)
+        try:
+            while not self._try_acquire(ticket):
+                if not blocking:
+                    return False
+                if on_event_loop:
+                    raise RuntimeError(
+                        f"No {self.provider} LLM slot is free and a sync call "
+                        "cannot wait on the event loop thread; use the async API"
+                    )
+                time.sleep(self.check_every_n_seconds)
+        finally:
+            self._discard(ticket)
+
+        ident = threading.get_ident()
+        with self._lock:
+            self._thread_slots[ident] = self._thread_slots.get(ident, 0) + 1
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        ticket = object()
+        with self._lock:
+            self._waiting.append(ticket)
+        try:
+            while not self._try_acquire(ticket):
+                if not blocking:
+                    return False
+                await asyncio.sleep(self.check_every_n_seconds)
+        finally:
+            self._discard(ticket)
+
+        task = asyncio.current_task()
+        with self._lock:
+            if task not in self._task_slots:
+                task.add_done_callback(self._release_task)
+            self._task_slots[task] = self._task_slots.get(task, 0) + 1
+        return True
+
+    def release_thread(self) -> None:
+        """Return a slot taken by a sync call on the calling thread, if any"""
+        ident = threading.get_ident()
+        with self._lock:
+            if not self._thread_slots.get(ident):
+                return
+            self._thread_slots[ident] -= 1
+            if not self._thread_slots[ident]:
+                del self._thread_slots[ident]
+            self._in_flight -= 1
+
+    def record_tokens(self, tokens: int) -> None:
+        if not tokens:
+            return
+        with self._lock:
+            self._token_usage.append((time.monotonic(), tokens))
+            self._tokens_in_window += tokens
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._prune(time.monotonic())
+            return {
+                "provider": self.provider,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiting),
+                "requests_last_minute": len(self._request_times),
+                "tokens_last_minute": self._tokens_in_window,
+            }
+
+    def _try_acquire(self, ticket: object) -> bool:
+        with self._lock:
+            if self._waiting[0] is not ticket:
+                return False
+
+            now = time.monotonic()
+            self._prune(now)
+            if self.max_in_flight and self._in_flight >= self.max_in_flight:
+                return False
+            if (
+                self.requests_per_minute
+                and len(self._request_times) >= self.requests_per_minute
+            ):
+                return False
+            if (
+                self.tokens_per_minute
+                and self._tokens_in_window >= self.tokens_per_minute
+            ):
+                return False
+
+            self._waiting.popleft()
+            self._request_times.append(now)
+            self._in_flight += 1
+            return True
+
+    def _release_task(self, task: asyncio.Task) -> None:
+        with self._lock:
+            self._in_flight -= self._task_slots.pop(task, 0)
+
+    def _discard(self, ticket: object) -> None:
+        with self._lock:
+            try:
+                self._waiting.remove(ticket)
+            except ValueError:
+                pass
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - WINDOW_SECONDS
+        while self._request_times and self._request_times[0] < cutoff:
+            self._request_times.popleft()
+        while self._token_usage and self._token_usage[0][0] < cutoff:
+            self._tokens_in_window -= self._token_usage.popleft()[1]
+
+
+class GovernorCallbackHandler(BaseCallbackHandler):
+    """Records token usage and returns sync calls' slots when a model call ends.
+
+    Async calls take their slot in a child task of the model call, out of
+    reach of the callbacks; it is returned when that task finishes.
+    """
+
+    # Release on the calling thread rather than on an executor thread
+    run_inline = True
+
+    def __init__(self, governor: LlmGovernor):
+        self.governor = governor
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.governor.record_tokens(_total_tokens(response))
+        self.governor.release_thread()
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self.governor.release_thread()
+
+
+def _total_tokens(response: LLMResult) -> int:
+    total = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    if not total and response.llm_output:
+        total = (response.llm_output.get("token_usage") or {}).get("total_tokens", 0)
+    return total
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_governors: Dict[str, LlmGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_llm_governor(provider: str) -> LlmGovernor:
+    """Return the process-wide governor for an LLM provider"""
+    with _governors_lock:
+        if provider not in _governors:
+            _governors[provider] = LlmGovernor(
+                provider=provider,
+                requests_per_minute=_provider_limit(
+                    "LLM_REQUESTS_PER_MINUTE", provider, LLM_REQUESTS_PER_MINUTE
+                ),
+                tokens_per_minute=_provider_limit(
+                    "LLM_TOKENS_PER_MINUTE", provider, LLM_TOKENS_PER_MINUTE
+                ),
+                max_in_flight=_provider_limit(
+                    "LLM_MAX_IN_FLIGHT", provider, LLM_MAX_IN_FLIGHT
+                ),
+            )
+        return _governors[provider]
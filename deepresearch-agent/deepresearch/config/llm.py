@@ -1,30 +1,163 @@
-
 import logging
+import os
+import threading
+from typing import Callable, Dict, NamedTuple, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
-from langchain_openai.chat_models import ChatOpenAI
-from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 
 from deepresearch.config.env import OPENAI_API_KEY
 from deepresearch.config.env import GOOGLE_API_KEY
 from deepresearch.config.env import LLM_PROVIDER
+from deepresearch.config.gemini_models import GeminiModel
+from deepresearch.config.governor import get_llm_governor
+from deepresearch.config.metrics import get_llm_metrics
+from deepresearch.config.openai_models import OpenAIModel
+from deepresearch.core.constants import ModelRole
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+
+class ModelSettings(NamedTuple):
+    model: str
+    temperature: float
+    # None leaves the provider's limit in place
+    max_tokens: Optional[int]
+    timeout: float
+
+
+# Per provider and role. Page summarization makes up most of the calls of a
+# run and goes to the lite tier, the other roles share the default tier.
+# Gemini 2.5 counts thinking tokens against the output limit.
+_OPENAI = OpenAIModel.GPT_4O_MINI.value
+_OPENAI_LITE = OpenAIModel.GPT_4_1_NANO.value
+_GEMINI = GeminiModel.GEMINI_2_5_FLASH.value
+_GEMINI_LITE = GeminiModel.GEMINI_2_5_FLASH_LITE.value
+
+ROLE_DEFAULTS: Dict[str, Dict[Optional[ModelRole], ModelSettings]] = {
+    "openai": {
+        None: ModelSettings(_OPENAI, 0.5, None, 120),
+        ModelRole.CLARIFIER: ModelSettings(_OPENAI, 0.5, 2048, 60),
+        ModelRole.SUPERVISOR: ModelSettings(_OPENAI, 0.5, 4096, 120),
+        ModelRole.RESEARCHER: ModelSettings(_OPENAI, 0.5, 4096, 120),
+        ModelRole.SUMMARIZER: ModelSettings(_OPENAI_LITE, 0.2, 2048, 60),
+        ModelRole.COMPRESSOR: ModelSettings(_OPENAI, 0.2, 8192, 180),
+        ModelRole.WRITER: ModelSettings(_OPENAI, 0.5, None, 300),
+    },
+    "google": {
+        None: ModelSettings(_GEMINI, 0.5, None, 120),
+        ModelRole.CLARIFIER: ModelSettings(_GEMINI, 0.5, 8192, 60),
+        ModelRole.SUPERVISOR: ModelSettings(_GEMINI, 0.5, 16384, 120),
+        ModelRole.RESEARCHER: ModelSettings(_GEMINI, 0.5, 16384, 120),
+        ModelRole.SUMMARIZER: ModelSettings(_GEMINI_LITE, 0.2, 8192, 60),
+        ModelRole.COMPRESSOR: ModelSettings(_GEMINI, 0.2, 16384, 180),
+        ModelRole.WRITER: ModelSettings(_GEMINI, 0.5, None, 300),
+    },
+}
+
+
+def _role_setting(name: str, role: Optional[ModelRole], default, cast: Callable):
+    """Read ``<name>_<ROLE>``, then ``<name>``, then fall back to the default"""
+    value = os.getenv(f"{name}_{role.value.upper()}") if role else None
+    if not value:
+        value = os.getenv(name)
+    return cast(value) if value else default
+
+
+def _max_tokens(value: str) -> Optional[int]:
+    return int(value) or None
+
+
+def model_settings(role: Optional[ModelRole] = None) -> ModelSettings:
+    """Settings of the model serving a role, with environment overrides applied"""
+    if LLM_PROVIDER not in ROLE_DEFAULTS:
+        raise ValueError("Invalid LLM Provider!")
+
+    defaults = ROLE_DEFAULTS[LLM_PROVIDER].get(role, ROLE_DEFAULTS[LLM_PROVIDER][None])
+    return ModelSettings(
+        model=_role_setting("LLM_MODEL", role, defaults.model, str),
+        temperature=_role_setting("LLM_TEMPERATURE", role, defaults.temperature, float),
+        max_tokens=_role_setting("LLM_MAX_TOKENS", role, defaults.max_tokens, _max_tokens),
+        timeout=_role_setting("LLM_TIMEOUT", role, defaults.timeout, float),
+    )
+
+
 class LlmService:
+    """Registry of chat models, one per role, built on first use.
+
+    Nothing is constructed at import time, so importing the graphs needs no
+    API keys and no provider SDK until a model is actually called. Models bound
+    to a set of tools are cached as well. Each role gets its own model,
+    temperature, output limit and timeout, see ``model_settings``.
+    """
+
+    _models: Dict[Optional[ModelRole], BaseChatModel] = {}
+    _bound: Dict[Tuple[Optional[ModelRole], Tuple[str, ...]], Runnable] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_model(
+        cls, role: Optional[ModelRole] = None, tools: Optional[Sequence] = None
+    ):
+        with cls._lock:
+            model = cls._models.get(role)
+            if model is None:
+                model = cls._build_model(role)
+                if model is None:
+                    return None
+                cls._models[role] = model
+
+            if not tools:
+                return model
+
+            key = (role, tuple(_tool_name(tool) for tool in tools))
+            if key not in cls._bound:
+                cls._bound[key] = model.bind_tools(tools)
+            return cls._bound[key]
+
+    @classmethod
+    def set_model(cls, role: Optional[ModelRole], model: BaseChatModel) -> None:
+        """Use the given model for a role, e.g. a local stand-in for benchmarks"""
+        with cls._lock:
+            cls._models[role] = model
+            cls._bound = {
+                key: bound for key, bound in cls._bound.items() if key[0] != role
+            }
+
     @classmethod
-    def get_model(cls):
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._models.clear()
+            cls._bound.clear()
+
+    @classmethod
+    def _build_model(cls, role: Optional[ModelRole]):
+        # Metrics are labelled with the role a model plays in the graph
+        metadata = {"role": role.value if role else "default"}
+        metrics_handler = get_llm_metrics().callback_handler
+        settings = model_settings(role)
+
         if LLM_PROVIDER=="openai":
             if not OPENAI_API_KEY:
                 raise ValueError("Issue in OpenAI API Key!")
 
             try:
-                model_name = "gpt-4o-mini"
-                llm = ChatOpenAI(model=model_name, temperature=0.5)
-                logger.info("Using OpenAI model")
-                print("Using OpenAI model")
+                from langchain_openai.chat_models import ChatOpenAI
+
+                governor = get_llm_governor("openai")
+                llm = ChatOpenAI(
+                    model=settings.model,
+                    temperature=settings.temperature,
+                    max_tokens=settings.max_tokens,
+                    timeout=settings.timeout,
+                    rate_limiter=governor,
+                    callbacks=[governor.callback_handler, metrics_handler],
+                    metadata=metadata,
+                )
+                logger.info(f"Using OpenAI model {settings.model} for {metadata['role']}")
                 return llm
             except Exception:
                 return None
@@ -33,12 +166,25 @@ class LlmService:
                 raise ValueError("Issue in Google API Key!")
 
             try:
-                model_name = "gemini-2.5-flash"
-                llm = ChatGoogleGenerativeAI(model=model_name, temperature=0.5)
-                logger.info("Using Google model")
+                from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
+
+                governor = get_llm_governor("google")
+                llm = ChatGoogleGenerativeAI(
+                    model=settings.model,
+                    temperature=settings.temperature,
+                    max_tokens=settings.max_tokens,
+                    timeout=settings.timeout,
+                    rate_limiter=governor,
+                    callbacks=[governor.callback_handler, metrics_handler],
+                    metadata=metadata,
+                )
+                logger.info(f"Using Google model {settings.model} for {metadata['role']}")
                 return llm
             except Exception:
                 return None
         else:
             raise ValueError("Invalid LLM Provider!")
-   
\ No newline at end of file
+
+
+def _tool_name(tool) -> str:
+    return getattr(tool, "name", None) or getattr(tool, "__name__", repr(tool))
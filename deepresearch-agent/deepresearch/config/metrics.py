@@ -0,0 +1,330 @@
+import contextvars
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+# Upper bounds of the LLM latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0)
+
+# USD per million (prompt, completion) tokens, used to estimate cost
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
+UNKNOWN = "unknown"
+
+# Calls that never report an end (e.g. cancelled) are forgotten after this long
+STALE_CALL_SECONDS = 3600
+
+# (node, role, model)
+Labels = Tuple[str, str, str]
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimated USD cost of a call, 0 for models without a known price"""
+    prompt_price, completion_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1e6
+
+
+class _Series:
+    """Aggregated LLM calls sharing one set of labels"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * len(LATENCY_BUCKETS)
+
+    def observe(
+        self,
+        latency: float,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cost: float = 0.0,
+        error: bool = False,
+    ) -> None:
+        self.calls += 1
+        self.errors += int(error)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost += cost
+        self.latency_sum += latency
+        index = bisect_left(LATENCY_BUCKETS, latency)
+        if index < len(LATENCY_BUCKETS):
+            self.latency_buckets[index] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cost_usd": round(self.cost, 6),
+            "latency_seconds": round(self.latency_sum, 3),
+        }
+
+
+class RunMetrics:
+    """LLM usage of a single agent run, broken down by graph node and model role"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.total = _Series()
+        self.nodes: Dict[str, _Series] = defaultdict(_Series)
+        self.roles: Dict[str, _Series] = defaultdict(_Series)
+        # Other events of the run, e.g. research unit retries
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, **values: Any) -> None:
+        node, role, _ = labels
+        with self._lock:
+            self.total.observe(**values)
+            self.nodes[node].observe(**values)
+            self.roles[role].observe(**values)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "duration_seconds": round(time.monotonic() - self.started_at, 3),
+                **self.total.summary(),
+                "nodes": {node: s.summary() for node, s in self.nodes.items()},
+                "roles": {role: s.summary() for role, s in self.roles.items()},
+                "counters": dict(self.counters),
+            }
+
+
+_current_run: contextvars.ContextVar[Optional[RunMetrics]] = contextvars.ContextVar(
+    "current_run_metrics", default=None
+)
+
+
+@contextmanager
+def track_run_metrics() -> Iterator[RunMetrics]:
+    """Collect the LLM usage of every call made inside the block"""
+    run_metrics = RunMetrics()
+    token = _current_run.set(run_metrics)
+    try:
+        yield run_metrics
+    finally:
+        _current_run.reset(token)
+
+
+def count_run_event(name: str, value: int = 1) -> None:
+    """Add to a counter of the current run, if its metrics are tracked"""
+    run_metrics = _current_run.get()
+    if run_metrics is not None:
+        run_metrics.increment(name, value)
+
+
+class LlmMetrics:
+    """Process-wide LLM call metrics, exported in Prometheus text format"""
+
+    def __init__(self):
+        self.callback_handler = MetricsCallbackHandler(self)
+        self._series: Dict[Labels, _Series] = defaultdict(_Series)
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, **values: Any) -> None:
+        with self._lock:
+            self._series[labels].observe(**values)
+        run_metrics = _current_run.get()
+        if run_metrics is not None:
+            run_metrics.observe(labels, **values)
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            series = list(self._series.items())
+
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples) -> None:
+            lines.append(f"# HELP deepresearch_{name} {help_text}")
+            lines.append(f"# TYPE deepresearch_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"deepresearch_{name}{suffix}{{{labels}}} {value}")
+
+        def label_text(labels: Labels, **extra: str) -> str:
+            node, role, model = labels
+            pairs = {"node": node, "role": role, "model": model, **extra}
+            return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+        metric(
+            "llm_calls_total",
+            "counter",
+            "LLM calls.",
+            [("", label_text(labels), s.calls) for labels, s in series],
+        )
+        metric(
+            "llm_errors_total",
+            "counter",
+            "LLM calls that raised an error.",
+            [("", label_text(labels), s.errors) for labels, s in series],
+        )
+        metric(
+            "llm_prompt_tokens_total",
+            "counter",
+            "Prompt tokens sent to LLMs.",
+            [("", label_text(labels), s.prompt_tokens) for labels, s in series],
+        )
+        metric(
+            "llm_completion_tokens_total",
+            "counter",
+            "Completion tokens returned by LLMs.",
+            [("", label_text(labels), s.completion_tokens) for labels, s in series],
+        )
+        metric(
+            "llm_cost_usd_total",
+            "counter",
+            "Estimated LLM cost in USD.",
+            [("", label_text(labels), f"{s.cost:.6f}") for labels, s in series],
+        )
+
+        latency_samples = []
+        for labels, s in series:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, s.latency_buckets):
+                cumulative += count
+                latency_samples.append(
+                    ("_bucket", label_text(labels, le=str(bound)), cumulative)
+                )
+            latency_samples.append(("_bucket", label_text(labels, le="+Inf"), s.calls))
+            latency_samples.append(("_sum", label_text(labels), f"{s.latency_sum:.6f}"))
+            latency_samples.append(("_count", label_text(labels), s.calls))
+        metric(
+            "llm_latency_seconds",
+            "histogram",
+            "LLM call latency in seconds.",
+            latency_samples,
+        )
+
+        return "\n".join(lines) + "\n"
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """Times every chat model call and records its token usage and cost"""
+
+    # Run in the caller's context so the current run's metrics are visible
+    run_inline = True
+
+    def __init__(self, metrics: LlmMetrics):
+        self.metrics = metrics
+        self._started: Dict[UUID, Tuple[float, Labels]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = metadata or {}
+        labels = (
+            _label(metadata.get("langgraph_node")),
+            _label(metadata.get("role")),
+            _label(metadata.get("ls_model_name")),
+        )
+        now = time.monotonic()
+        with self._lock:
+            self._started[run_id] = (now, labels)
+            if len(self._started) > 1000:
+                self._started = {
+                    key: value
+                    for key, value in self._started.items()
+                    if now - value[0] < STALE_CALL_SECONDS
+                }
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._pop(run_id)
+        if started is None:
+            return
+        started_at, labels = started
+        prompt_tokens, completion_tokens = _token_usage(response)
+        self.metrics.observe(
+            labels,
+            latency=time.monotonic() - started_at,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=estimate_cost(labels[2], prompt_tokens, completion_tokens),
+        )
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        started = self._pop(run_id)
+        if started is None:
+            return
+        started_at, labels = started
+        self.metrics.observe(
+            labels, latency=time.monotonic() - started_at, error=True
+        )
+
+    def _pop(self, run_id: UUID) -> Optional[Tuple[float, Labels]]:
+        with self._lock:
+            return self._started.pop(run_id, None)
+
+
+def _token_usage(response: LLMResult) -> Tuple[int, int]:
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not (prompt_tokens or completion_tokens) and response.llm_output:
+        usage = response.llm_output.get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+def _label(value: Any) -> str:
+    if not value:
+        return UNKNOWN
+    # Graph nodes are registered under str enums
+    return str(getattr(value, "value", value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_llm_metrics: Optional[LlmMetrics] = None
+_llm_metrics_lock = threading.Lock()
+
+
+def get_llm_metrics() -> LlmMetrics:
+    """Return the process-wide LLM metrics"""
+    global _llm_metrics
+
+    with _llm_metrics_lock:
+        if _llm_metrics is None:
+            _llm_metrics = LlmMetrics()
+        return _llm_metrics
@@ -0,0 +1,8 @@
+from enum import Enum as PyEnum
+
+class OpenAIModel(PyEnum):
+    GPT_4_1 = "gpt-4.1"
+    GPT_4_1_MINI = "gpt-4.1-mini"
+    GPT_4_1_NANO = "gpt-4.1-nano"
+    GPT_4O = "gpt-4o"
+    GPT_4O_MINI = "gpt-4o-mini"
@@ -11,6 +11,9 @@ class GraphNode(str, PyEnum):
     LLM_CALL = "llm_call"
     TOOL_NODE = "tool_node"
     COMPRESS_RESEARCH = "compress_research"
+    COMPACT_CONTEXT = "compact_context"
+    CONDENSE_FINDINGS = "condense_findings"
+    REUSE_RESEARCH = "reuse_research"
     SUPERVISOR_TOOLS = "supervisor_tools"
     SUPERVISOR = "supervisor"
     RESEARCH_COMPLETE = "ResearchComplete"
@@ -35,6 +38,48 @@ class ConfigClass(str, PyEnum):
     RESEARCH_TOPIC = "research_topic"
     COMPRESSED_RESEARCH = "compressed_research"
     RESEARCH_ITERATIONS = "research_iterations"
+    RESEARCH_DIGEST = "research_digest"
+    DIGESTED_MESSAGES = "digested_messages"
+    CONDENSED_NOTES = "condensed_notes"
+    RESEARCH_TOKENS = "research_tokens"
+    RESEARCH_STARTED_AT = "research_started_at"
+    RESEARCHER_MAX_TOOL_CALLS = "researcher_max_tool_calls"
+    RESEARCHER_MAX_TOKENS = "researcher_max_tokens"
+    RESEARCHER_TIMEOUT = "researcher_timeout"
+    REUSE_RESEARCH = "reuse_research"
+    REUSED_RESEARCH = "reused_research"
+
+
+class StreamEvent(str, PyEnum):
+    NODE_START = "node_start"
+    NODE_END = "node_end"
+    RESEARCH_START = "research_start"
+    RESEARCH_END = "research_end"
+    TOKEN = "token"
+    DONE = "done"
+    ERROR = "error"
+
+
+class JobStatus(str, PyEnum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ModelRole(str, PyEnum):
+    CLARIFIER = "clarifier"
+    SUPERVISOR = "supervisor"
+    RESEARCHER = "researcher"
+    SUMMARIZER = "summarizer"
+    COMPRESSOR = "compressor"
+    WRITER = "writer"
+
+
+class ThreadStatus(str, PyEnum):
+    ACTIVE = "active"
+    FINISHED = "finished"
 
 
 class OpikPrompts(PyEnum):
@@ -49,6 +94,8 @@ class OpikPrompts(PyEnum):
     COMPRESS_RESEACH_SYSTEM_PROMPT = "compress_research_system_prompt"
     COMPRESS_RESEACH_HUMAN_MESSAGE = "compress_research_human_message"
     FINAL_REPORT_GENERTATION_PROMPT = "final_report_generation_prompt"
+    COMPACT_RESEARCH_PROMPT = "compact_research_prompt"
+    CONDENSE_FINDINGS_PROMPT = "condense_findings_prompt"
 
 class StartEvaluationOpikPrompt(PyEnum):
     STARTUP_CLARIFY_WITH_USER_INSTRUCTIONS = "startup_clarify_with_user_instructions"
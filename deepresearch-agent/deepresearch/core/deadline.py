@@ -0,0 +1,91 @@
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from deepresearch.config.env import RUN_WRAP_UP_SECONDS
+
+
+class RunDeadlineExceeded(Exception):
+    """The run passed its deadline and no partial report was requested"""
+
+
+class RunDeadline:
+    """Deadline and cancellation token of one agent run.
+
+    Set at the API layer and visible to every node, research unit and tool of
+    the run through a context variable. Research units stop taking new steps
+    once it expires and the supervisor stops delegating, so that a partial
+    report can be written from the notes gathered so far within
+    ``wrap_up`` seconds. ``cancel`` expires the run immediately.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float],
+        partial_report: bool = True,
+        wrap_up: float = RUN_WRAP_UP_SECONDS,
+    ):
+        self.expires_at = time.monotonic() + timeout if timeout else None
+        self.partial_report = partial_report
+        self.wrap_up = wrap_up if partial_report else 0.0
+        # Set once research was cut short by the deadline
+        self.stopped_early = False
+        self.reason: Optional[str] = None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, None without a deadline"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def hard_limit(self) -> Optional[float]:
+        """Seconds left before the whole run, partial report included, is cancelled"""
+        remaining = self.remaining()
+        return None if remaining is None else remaining + self.wrap_up
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() == 0
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        self.reason = reason
+        self.expires_at = time.monotonic()
+
+    async def run(self, awaitable):
+        """Await the run, cancelling it once the hard limit passes"""
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.hard_limit())
+        except asyncio.TimeoutError:
+            raise RunDeadlineExceeded(
+                f"Run cancelled after its deadline ({self.reason or 'timeout'})"
+            )
+
+
+_current_deadline: contextvars.ContextVar[Optional[RunDeadline]] = (
+    contextvars.ContextVar("current_run_deadline", default=None)
+)
+
+
+@contextmanager
+def run_deadline(
+    timeout: Optional[float], partial_report: bool = True
+) -> Iterator[RunDeadline]:
+    """Apply a deadline to every node and tool of the run started inside the block"""
+    deadline = RunDeadline(timeout, partial_report)
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[RunDeadline]:
+    return _current_deadline.get()
+
+
+def remaining_run_time() -> Optional[float]:
+    """Seconds left before the current run's deadline, None without one"""
+    deadline = _current_deadline.get()
+    return deadline.remaining() if deadline is not None else None
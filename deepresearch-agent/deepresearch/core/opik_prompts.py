@@ -1,20 +1,206 @@
-import opik
+import json
+import logging
+import threading
+import time
+from enum import Enum as PyEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
-from deepresearch.config.env import OPIK_API_KEY
+from deepresearch.config.env import (
+    CACHE_DIR,
+    OPIK_API_KEY,
+    PROMPT_CACHE_TTL,
+    PROMPT_VERSIONS,
+)
+from deepresearch.core.constants import OpikPrompts
+
+if TYPE_CHECKING:
+    import opik
+
+logger = logging.getLogger(__name__)
+
+# Prompts shipped with the package, used when Opik has never been reachable
+BUNDLED_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+SNAPSHOT_DIR = Path(CACHE_DIR) / "prompts"
+
+LOCAL_VERSION = "local"
+
+
+def _parse_pinned_versions(value: str) -> Dict[str, str]:
+    pinned = {}
+    for item in value.split(","):
+        name, _, commit = item.partition("=")
+        if name.strip() and commit.strip():
+            pinned[name.strip()] = commit.strip()
+    return pinned
+
+
+class _CachedPrompt:
+    __slots__ = ("prompt", "commit", "fetched_at")
+
+    def __init__(self, prompt: str, commit: Optional[str], fetched_at: float):
+        self.prompt = prompt
+        self.commit = commit
+        self.fetched_at = fetched_at
 
 
 class Opik_prompts:
-    """Wrapper class for Opik Prpmpt managent tool"""
+    """Wrapper class for Opik Prpmpt managent tool
+
+    Prompts are cached for the life of the process. Entries older than
+    PROMPT_CACHE_TTL are still served while a background thread revalidates
+    them, and prompts pinned through PROMPT_VERSIONS are never refetched.
+    Every successful fetch is snapshotted to disk, latest and each pinned
+    version in its own file, so that the agent keeps working when Opik is
+    unreachable.
+    """
+
+    ttl: float = PROMPT_CACHE_TTL
+    pinned_versions: Dict[str, str] = _parse_pinned_versions(PROMPT_VERSIONS)
+
+    _client: Optional["opik.Opik"] = None
+    _cache: Dict[Tuple[str, Optional[str]], _CachedPrompt] = {}
+    _refreshing: set = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_prompt(cls, prompt_name, commit: Optional[str] = None) -> str:
+        name = cls._prompt_key(prompt_name)
+        commit = commit or cls.pinned_versions.get(name)
+        key = (name, commit)
+
+        with cls._lock:
+            cached = cls._cache.get(key)
+
+        if cached is None:
+            return cls._load(name, commit).prompt
+
+        # Pinned versions are immutable, only "latest" needs revalidating
+        if commit is None and time.monotonic() - cached.fetched_at > cls.ttl:
+            cls._revalidate_in_background(name)
+
+        return cached.prompt
+
+    @classmethod
+    def get_prompt_version(cls, prompt_name) -> str:
+        """Return the commit of the cached prompt, fetching it if needed"""
+        name = cls._prompt_key(prompt_name)
+        commit = cls.pinned_versions.get(name)
+        with cls._lock:
+            cached = cls._cache.get((name, commit))
+        if cached is None:
+            cached = cls._load(name, commit)
+        return cached.commit or LOCAL_VERSION
+
+    @classmethod
+    def preload(cls) -> None:
+        """Warm the cache with every prompt the agents use"""
+        for prompt_name in OpikPrompts:
+            try:
+                cls.get_prompt(prompt_name)
+            except ValueError as e:
+                logger.warning(f"Could not preload prompt {prompt_name.value}: {e}")
 
     @classmethod
-    def get_prompt(cls, prompt_name):
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def _prompt_key(prompt_name) -> str:
+        return prompt_name.value if isinstance(prompt_name, PyEnum) else prompt_name
+
+    @classmethod
+    def _get_client(cls) -> "opik.Opik":
+        if cls._client is None:
+            # The Opik SDK takes seconds to import, defer it to the first fetch
+            import opik
+
+            cls._client = opik.Opik(api_key=OPIK_API_KEY)
+        return cls._client
+
+    @classmethod
+    def _load(cls, name: str, commit: Optional[str]) -> _CachedPrompt:
+        try:
+            cached = cls._fetch(name, commit)
+        except Exception as e:
+            logger.warning(f"Falling back to local snapshot for prompt {name}: {e}")
+            cached = cls._read_snapshot(name, commit)
+
+        with cls._lock:
+            cls._cache[(name, commit)] = cached
+        return cached
+
+    @classmethod
+    def _fetch(cls, name: str, commit: Optional[str]) -> _CachedPrompt:
         if not OPIK_API_KEY:
             raise ValueError("Opik API Key is missing")
 
+        prompt = cls._get_client().get_prompt(name=name, commit=commit)
+        if prompt is None:
+            raise ValueError(f"Prompt {name} not found in Opik")
+
+        cached = _CachedPrompt(prompt.prompt, prompt.commit, time.monotonic())
+        cls._write_snapshot(name, commit, cached)
+        return cached
+
+    @classmethod
+    def _revalidate_in_background(cls, name: str) -> None:
+        with cls._lock:
+            if name in cls._refreshing:
+                return
+            cls._refreshing.add(name)
+
+        def refresh():
+            try:
+                cached = cls._fetch(name, None)
+                with cls._lock:
+                    cls._cache[(name, None)] = cached
+            except Exception as e:
+                # Keep serving the stale entry, retry after another TTL
+                logger.warning(f"Failed to revalidate prompt {name}: {e}")
+                with cls._lock:
+                    stale = cls._cache.get((name, None))
+                    if stale is not None:
+                        stale.fetched_at = time.monotonic()
+            finally:
+                with cls._lock:
+                    cls._refreshing.discard(name)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    @staticmethod
+    def _snapshot_path(name: str, commit: Optional[str]) -> Path:
+        """Snapshot of latest, or of the pinned commit when one is requested"""
+        return SNAPSHOT_DIR / (f"{name}@{commit}.json" if commit else f"{name}.json")
+
+    @classmethod
+    def _write_snapshot(
+        cls, name: str, commit: Optional[str], cached: _CachedPrompt
+    ) -> None:
         try:
-            opik_client = opik.Opik(api_key=OPIK_API_KEY)
-            prompt = opik_client.get_prompt(name=prompt_name)
-            return prompt.prompt
+            SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+            path = cls._snapshot_path(name, commit)
+            tmp_path = path.with_suffix(".json.tmp")
+            tmp_path.write_text(
+                json.dumps({"prompt": cached.prompt, "commit": cached.commit})
+            )
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not snapshot prompt {name}: {e}")
+
+    @classmethod
+    def _read_snapshot(cls, name: str, commit: Optional[str]) -> _CachedPrompt:
+        snapshot_path = cls._snapshot_path(name, commit)
+        if snapshot_path.exists():
+            snapshot = json.loads(snapshot_path.read_text())
+            if commit is None or snapshot.get("commit") == commit:
+                return _CachedPrompt(
+                    snapshot["prompt"], snapshot.get("commit"), time.monotonic()
+                )
+
+        bundled_path = BUNDLED_PROMPTS_DIR / f"{name}.txt"
+        if commit is None and bundled_path.exists():
+            return _CachedPrompt(bundled_path.read_text(), None, time.monotonic())
 
-        except Exception:
-            return None
+        raise ValueError(f"Prompt {name} is unavailable from Opik and has no snapshot")
@@ -14,7 +14,11 @@ class AgentState(MessagesState):
     supervisor_messages: Annotated[Sequence[BaseMessage], add_messages]
     raw_notes: Annotated[list[str], operator.add]
     notes: Annotated[list[str], operator.add]
+    # Notes condensed for the final report when they are too large to use as is
+    condensed_notes: list[str]
     final_report: str
+    # Set when the notes or report come from an earlier run of a similar brief
+    reused_research: bool
 
 
 class ResearcherState(MessagesState):
@@ -23,6 +27,12 @@ class ResearcherState(MessagesState):
     research_topic: str
     compressed_research: str
     raw_notes: Annotated[List[str], operator.add]
+    # Running digest of researcher_messages[1:digested_messages]
+    research_digest: str
+    digested_messages: int
+    # Spent against the research unit's budget
+    research_tokens: int
+    research_started_at: float
 
 
 class ResearcherOutputState(MessagesState):
@@ -0,0 +1,240 @@
+"""Run a file of research briefs through the agent in bulk, without the chat API.
+
+Each input line is a JSON object with an ``id`` and a ``brief``. Briefs skip
+the clarification and brief-writing steps and go straight to the supervisor
+and the final report, on a pool of ``--workers`` concurrent runs. Every
+finished brief is appended to the output file as one JSON line, so after a
+crash or an interrupt the same command resumes the batch: briefs already
+completed in the output are skipped and failed ones are run again.
+
+Usage:
+    python -m deepresearch.interface.batch briefs.jsonl --output reports.jsonl \\
+        --workers 4
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+from deepresearch.config.env import BATCH_WORKERS, RUN_TIMEOUT
+from deepresearch.config.metrics import track_run_metrics
+from deepresearch.core.constants import ConfigClass, JobStatus
+from deepresearch.core.deadline import RunDeadlineExceeded, run_deadline
+
+logger = logging.getLogger(__name__)
+
+RECURSION_LIMIT = 50
+
+
+def brief_id(record: Dict[str, Any]) -> str:
+    """Id of an input record, derived from its brief when not given"""
+    if record.get("id") is not None:
+        return str(record["id"])
+    return hashlib.sha256(record["brief"].encode()).hexdigest()[:16]
+
+
+def read_briefs(path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(id, record) of every brief in a JSONL file, skipping repeated ids"""
+    seen: Set[str] = set()
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            record.setdefault("brief", record.get(ConfigClass.RESEARCH_BRIEF))
+            if not record["brief"]:
+                raise ValueError(f"{path}:{line_number} has no brief")
+            record_id = brief_id(record)
+            if record_id in seen:
+                logger.warning(f"{path}:{line_number} repeats id {record_id}, skipped")
+                continue
+            seen.add(record_id)
+            yield record_id, record
+
+
+def completed_ids(path: str) -> Set[str]:
+    """Ids of the briefs already completed in an output file"""
+    completed: Set[str] = set()
+    if not os.path.exists(path):
+        return completed
+    with open(path) as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash, its brief runs again
+                continue
+            if result.get("status") == JobStatus.COMPLETED:
+                completed.add(result["id"])
+    return completed
+
+
+class ResultWriter:
+    """Appends results to a JSONL file, each durably written once it finishes"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self) -> "ResultWriter":
+        ends_with_newline = True
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                ends_with_newline = f.read(1) == b"\n"
+        self._file = open(self.path, "a")
+        if not ends_with_newline:
+            # Keep the next result off a line cut short by a crash
+            self._file.write("\n")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._file.close()
+
+    def write(self, result: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(result, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+async def run_brief(
+    record_id: str,
+    record: Dict[str, Any],
+    timeout: Optional[float],
+    partial_report: bool = True,
+) -> Dict[str, Any]:
+    """Research one brief and write its report, returning the result line"""
+    from deepresearch.agents.writer.graph import brief_agent, research_brief_input
+
+    if record.get("timeout_seconds") is not None:
+        timeout = record["timeout_seconds"]
+    config = {
+        ConfigClass.CONFIGURABLE: {ConfigClass.THREAD_ID: f"batch-{record_id}"},
+        "recursion_limit": RECURSION_LIMIT,
+    }
+    result: Dict[str, Any] = {"id": record_id, "brief": record["brief"]}
+    start = time.perf_counter()
+
+    with track_run_metrics() as run_metrics, run_deadline(
+        timeout, partial_report=partial_report
+    ) as deadline:
+        try:
+            state = await deadline.run(
+                brief_agent.ainvoke(research_brief_input(record["brief"]), config=config)
+            )
+            result.update(
+                status=JobStatus.COMPLETED,
+                report=state.get(ConfigClass.FINAL_REPORT),
+                partial=deadline.stopped_early,
+                reused_research=bool(state.get(ConfigClass.REUSED_RESEARCH)),
+            )
+        except Exception as e:
+            if isinstance(e, RunDeadlineExceeded):
+                logger.warning(f"Brief {record_id} failed: {e}")
+            else:
+                logger.exception(f"Brief {record_id} failed")
+            result.update(status=JobStatus.FAILED, error=f"{type(e).__name__}: {e}")
+
+    result.update(
+        elapsed_s=round(time.perf_counter() - start, 3),
+        finished_at=datetime.now(timezone.utc).isoformat(),
+        metrics=run_metrics.summary(),
+    )
+    return result
+
+
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    workers: int = BATCH_WORKERS,
+    timeout: Optional[float] = RUN_TIMEOUT,
+    partial_report: bool = True,
+) -> Dict[str, int]:
+    """Run every brief not yet completed in the output, ``workers`` at a time"""
+    from deepresearch.tools.pplxapi import close_async_perplexity_client
+    from deepresearch.tools.tavilyapi import close_async_tavily_client
+
+    done = completed_ids(output_path)
+    counts = {"skipped": 0, JobStatus.COMPLETED.value: 0, JobStatus.FAILED.value: 0}
+    # Bounded, so briefs are read from the input only as workers free up
+    queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+
+    async def worker(writer: ResultWriter) -> None:
+        while (item := await queue.get()) is not None:
+            result = await run_brief(*item, timeout, partial_report)
+            writer.write(result)
+            counts[result["status"]] += 1
+            logger.info(
+                f"Brief {result['id']} {result['status']} in {result['elapsed_s']}s"
+            )
+
+    async def producer() -> None:
+        for record_id, record in read_briefs(input_path):
+            if record_id in done:
+                counts["skipped"] += 1
+                continue
+            await queue.put((record_id, record))
+        for _ in range(workers):
+            await queue.put(None)
+
+    with ResultWriter(output_path) as writer:
+        # Run alongside the workers, so an error in any of them surfaces here
+        # instead of leaving the producer blocked on a full queue
+        tasks = [asyncio.create_task(producer())]
+        tasks += [asyncio.create_task(worker(writer)) for _ in range(workers)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await close_async_tavily_client()
+            await close_async_perplexity_client()
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL file of {id, brief} records")
+    parser.add_argument("--output", required=True, help="JSONL file of results")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=RUN_TIMEOUT,
+        help="Deadline of each brief in seconds, 0 for none",
+    )
+    parser.add_argument(
+        "--no-partial-report",
+        action="store_true",
+        help="Fail briefs that pass their deadline instead of reporting what was found",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="[%(levelname)s] %(asctime)s | %(message)s"
+    )
+    counts = asyncio.run(
+        run_batch(
+            args.input,
+            args.output,
+            workers=max(1, args.workers),
+            timeout=args.timeout,
+            partial_report=not args.no_partial_report,
+        )
+    )
+    print(json.dumps(counts))
+    if counts[JobStatus.FAILED]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
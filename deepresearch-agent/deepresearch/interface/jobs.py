@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from deepresearch.core.constants import JobStatus
+from deepresearch.interface.schema import ChatRequest, ChatResponse, ResearchJob
+from deepresearch.tools.utils import generate_session_id
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class JobQueueFullError(Exception):
+    """Raised when the research job queue is at capacity"""
+
+
+class ResearchJobManager:
+    """Runs research requests on a fixed pool of workers behind a bounded queue.
+
+    ``submit`` returns immediately; callers poll the job by id. When the queue
+    is full new submissions are rejected so the API can apply backpressure.
+    Only jobs still waiting count against its capacity: a job cancelled while
+    queued frees its place at once and is skipped when a worker dequeues it.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[ChatRequest], Awaitable[ChatResponse]],
+        workers: int,
+        max_queue_size: int,
+    ):
+        self.run = run
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.jobs: Dict[str, ResearchJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        # Jobs waiting to run, the queue itself also holds cancelled ones
+        self._queued = 0
+        self._worker_tasks: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"research-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def submit(self, request: ChatRequest) -> ResearchJob:
+        job = ResearchJob(
+            job_id=generate_session_id(),
+            request=request,
+            created_at=datetime.now(timezone.utc),
+        )
+        if self._queued >= self.max_queue_size:
+            raise JobQueueFullError(
+                f"Research queue is full ({self.max_queue_size} jobs waiting)"
+            )
+        self._queue.put_nowait(job.job_id)
+        self._queued += 1
+        self.jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ResearchJob]:
+        return self.jobs.get(job_id)
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """1-based position among queued jobs, or None if not queued"""
+        queued = [
+            job.job_id
+            for job in self.jobs.values()
+            if job.status == JobStatus.QUEUED
+        ]
+        return queued.index(job_id) + 1 if job_id in queued else None
+
+    def cancel(self, job_id: str) -> Optional[ResearchJob]:
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATUSES:
+            return job
+
+        task = self._running.get(job_id)
+        if task is not None:
+            # The worker records the cancellation when the task unwinds
+            task.cancel()
+        else:
+            # Still queued; the worker skips it when dequeued
+            self._queued -= 1
+            self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    def prune(self, max_age: float) -> int:
+        """Forget finished jobs older than max_age seconds"""
+        cutoff = datetime.now(timezone.utc).timestamp() - max_age
+        stale = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job.status in FINISHED_STATUSES
+            and job.finished_at.timestamp() < cutoff
+        ]
+        for job_id in stale:
+            del self.jobs[job_id]
+        return len(stale)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": len(self._running),
+            "queued": self._queued,
+            "max_queue_size": self.max_queue_size,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                job = self.jobs.get(job_id)
+                if job is None or job.status != JobStatus.QUEUED:
+                    continue
+                self._queued -= 1
+                await self._run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job: ResearchJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        task = asyncio.create_task(self.run(job.request))
+        self._running[job.job_id] = task
+        try:
+            job.result = await task
+            self._finish(job, JobStatus.COMPLETED)
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED)
+            # Propagate if the worker itself is being shut down
+            if asyncio.current_task().cancelling():
+                raise
+        except Exception as e:
+            logger.exception(f"Research job {job.job_id} failed")
+            job.error = str(e)
+            self._finish(job, JobStatus.FAILED)
+        finally:
+            self._running.pop(job.job_id, None)
+
+    @staticmethod
+    def _finish(job: ResearchJob, status: JobStatus) -> None:
+        job.status = status
+        job.finished_at = datetime.now(timezone.utc)
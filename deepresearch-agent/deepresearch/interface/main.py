@@ -1,23 +1,128 @@
-from typing import Dict
-
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import aiosqlite
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import AIMessage
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+from langgraph.graph.state import CompiledStateGraph
 
 from deepresearch.agents.writer.graph import deep_researcher_builder
-from deepresearch.core.constants import ConfigClass
-from deepresearch.interface.schema import ChatRequest, ChatResponse
+from deepresearch.config.env import (
+    ACTIVE_THREAD_TTL,
+    CHECKPOINT_DB_PATH,
+    CHECKPOINT_MAX_MB,
+    FINISHED_THREAD_TTL,
+    MAX_FINISHED_THREADS,
+    RESEARCH_QUEUE_SIZE,
+    RESEARCH_WORKERS,
+    RUN_TIMEOUT,
+    THREAD_PRUNE_INTERVAL,
+)
+from deepresearch.config.metrics import (
+    RunMetrics,
+    get_llm_metrics,
+    track_run_metrics,
+)
+from deepresearch.core.constants import (
+    ConfigClass,
+    GraphNode,
+    StreamEvent,
+    ThreadStatus,
+)
+from deepresearch.core.deadline import RunDeadline, RunDeadlineExceeded, run_deadline
+from deepresearch.core.opik_prompts import Opik_prompts
+from deepresearch.interface.jobs import JobQueueFullError, ResearchJobManager
+from deepresearch.interface.schema import (
+    ChatRequest,
+    ChatResponse,
+    ResearchJob,
+    ResearchJobResponse,
+    ResearchLimits,
+)
+from deepresearch.interface.thread_store import ThreadStore
+from deepresearch.tools.pplxapi import close_async_perplexity_client
+from deepresearch.tools.tavilyapi import close_async_tavily_client
 from deepresearch.tools.utils import generate_session_id
 
+logger = logging.getLogger(__name__)
+
 RECURSION_LIMIT = 50
+SSE_HEARTBEAT_SECONDS = 15
+DISCONNECT_POLL_SECONDS = 1.0
+
+# Graph nodes whose start and end are reported on /chat/stream
+STREAMED_NODES = {
+    node.value
+    for node in (
+        GraphNode.CLARIFY_WITH_USER,
+        GraphNode.WRITE_RESEARCH_BRIEF,
+        GraphNode.REUSE_RESEARCH,
+        GraphNode.SUPERVISOR,
+        GraphNode.SUPERVISOR_TOOLS,
+        GraphNode.COMPRESS_RESEARCH,
+        GraphNode.CONDENSE_FINDINGS,
+        GraphNode.FINAL_REPORT_GENERATION,
+    )
+}
+
+# Opened in lifespan: checkpoints and the thread registry live in SQLite so
+# conversations survive restarts and memory stays flat as threads accumulate.
+checkpointer: Optional[AsyncSqliteSaver] = None
+full_agent: Optional[CompiledStateGraph] = None
+thread_store: Optional[ThreadStore] = None
+
+
+async def _prune_periodically() -> None:
+    """Apply thread and job retention every THREAD_PRUNE_INTERVAL seconds"""
+    while True:
+        try:
+            await thread_store.prune(checkpointer)
+            research_jobs.prune(FINISHED_THREAD_TTL)
+        except Exception:
+            logger.exception("Failed to prune threads")
+        await asyncio.sleep(THREAD_PRUNE_INTERVAL)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the checkpoint store and warm caches on startup, release them on shutdown"""
+    global checkpointer, full_agent, thread_store
+
+    os.makedirs(os.path.dirname(CHECKPOINT_DB_PATH) or ".", exist_ok=True)
+    async with aiosqlite.connect(CHECKPOINT_DB_PATH) as saver_conn, aiosqlite.connect(
+        CHECKPOINT_DB_PATH
+    ) as store_conn:
+        checkpointer = AsyncSqliteSaver(saver_conn)
+        await checkpointer.setup()
+        full_agent = deep_researcher_builder.compile(checkpointer=checkpointer)
+        thread_store = ThreadStore(
+            store_conn,
+            finished_ttl=FINISHED_THREAD_TTL,
+            active_ttl=ACTIVE_THREAD_TTL,
+            max_finished=MAX_FINISHED_THREADS,
+            max_bytes=int(CHECKPOINT_MAX_MB * 1024 * 1024),
+        )
+        await thread_store.setup()
 
-checkpointer = InMemorySaver()
-full_agent = deep_researcher_builder.compile(checkpointer=checkpointer)
-threads: Dict[str, Dict] = {}
+        await asyncio.to_thread(Opik_prompts.preload)
+        await research_jobs.start()
+        pruner = asyncio.create_task(_prune_periodically())
+        yield
+        pruner.cancel()
+        await research_jobs.stop()
+        await close_async_tavily_client()
+        await close_async_perplexity_client()
 
-app = FastAPI(title="DeepResearch Chatbot API", version="1.0")
+
+app = FastAPI(title="DeepResearch Chatbot API", version="1.0", lifespan=lifespan)
 
 # Enhanced CORS configuration
 app.add_middleware(
@@ -62,80 +167,157 @@ async def options_chat():
     return {"message": "OK"}
 
 
-@app.post("/chat")
-async def chat_with_agent(request: ChatRequest) -> ChatResponse:
-    """Chat Interface"""
-    try:
-        thread_id = request.thread_id or generate_session_id()
-        thread = threads.get(
-            thread_id,
-            {
-                ConfigClass.CONFIGURABLE: {
-                    ConfigClass.THREAD_ID: thread_id,
-                    "recursion_limit": RECURSION_LIMIT,
-                }
-            },
+def _resolve_thread(
+    thread_id: Optional[str],
+    research_limits: Optional[ResearchLimits] = None,
+    reuse_research: bool = True,
+) -> Tuple[str, Dict]:
+    """Return the thread id and graph config for a request"""
+    thread_id = thread_id or generate_session_id()
+    thread = {
+        ConfigClass.CONFIGURABLE: {
+            ConfigClass.THREAD_ID: thread_id,
+            ConfigClass.REUSE_RESEARCH: reuse_research,
+            "recursion_limit": RECURSION_LIMIT,
+        }
+    }
+    if research_limits is not None:
+        limits = {
+            ConfigClass.RESEARCHER_MAX_TOOL_CALLS: research_limits.max_tool_calls,
+            ConfigClass.RESEARCHER_MAX_TOKENS: research_limits.max_tokens,
+            ConfigClass.RESEARCHER_TIMEOUT: research_limits.timeout_seconds,
+        }
+        thread[ConfigClass.CONFIGURABLE].update(
+            {key: value for key, value in limits.items() if value is not None}
+        )
+    return thread_id, thread
+
+
+def _request_deadline(request: ChatRequest):
+    """Deadline of a chat turn, from the request or RUN_TIMEOUT"""
+    timeout = RUN_TIMEOUT if request.timeout_seconds is None else request.timeout_seconds
+    return run_deadline(timeout, partial_report=request.partial_report)
+
+
+async def _cancel_on_disconnect(http_request: Request, run: asyncio.Future) -> None:
+    """Cancel the run, and everything it has in flight, once the client is gone"""
+    while not run.done():
+        if await http_request.is_disconnected():
+            logger.info("Client disconnected, cancelling the run")
+            run.cancel()
+            return
+        await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+
+
+async def _build_chat_response(
+    thread_id: str,
+    response: Dict,
+    run_metrics: Optional[RunMetrics] = None,
+    deadline: Optional[RunDeadline] = None,
+) -> ChatResponse:
+    """Turn the final graph state into a ChatResponse and update the thread registry"""
+
+    # Check if we have a final report (research complete)
+    final_report = response.get("final_report")
+
+    # Extract the latest AI message from the messages array
+    messages = response.get(ConfigClass.MESSAGES, [])
+    latest_ai_message = None
+
+    # Find the last AI message in the conversation
+    for message in reversed(messages):
+        if isinstance(message, AIMessage):
+            latest_ai_message = message.content
+            break
+
+    # Determine response text
+    if final_report:
+        # Research is complete, return the final report
+        response_text = final_report
+    elif latest_ai_message:
+        # Use the latest AI message content
+        response_text = latest_ai_message
+    else:
+        # Fallback
+        response_text = "I'm processing your request. Please wait..."
+
+    print(f"Final response text: {response_text[:100]}...")  # Debug log (first 100 chars)
+    metrics = run_metrics.summary() if run_metrics else None
+
+    if final_report:
+        # Research complete - create new thread for next conversation
+        await thread_store.touch(thread_id, ThreadStatus.FINISHED)
+        new_thread_id = generate_session_id()
+        await thread_store.touch(new_thread_id)
+        return ChatResponse(
+            thread_id=new_thread_id,
+            response=final_report,
+            report=final_report,
+            is_followup=False,
+            metrics=metrics,
+            partial=deadline is not None and deadline.stopped_early,
+            reused_research=bool(response.get(ConfigClass.REUSED_RESEARCH)),
+        )
+    else:
+        # Clarification phase or intermediate step - keep using same thread
+        await thread_store.touch(thread_id)
+        return ChatResponse(
+            thread_id=thread_id,
+            response=response_text,
+            is_followup=True,
+            metrics=metrics,
         )
 
-        print(f"Processing message: {request.message}")  # Debug log
-        print(f"Using thread_id: {thread_id}")  # Debug log
 
-        response = await full_agent.ainvoke(
-            {ConfigClass.MESSAGES: [HumanMessage(content=request.message)]},
-            config=thread,
+async def _run_chat(
+    request: ChatRequest, http_request: Optional[Request] = None
+) -> ChatResponse:
+    """Run one chat turn through the agent, within the request's deadline"""
+    thread_id, thread = _resolve_thread(
+        request.thread_id, request.research_limits, request.reuse_research
+    )
+    await thread_store.touch(thread_id)
+
+    print(f"Processing message: {request.message}")  # Debug log
+    print(f"Using thread_id: {thread_id}")  # Debug log
+
+    with track_run_metrics() as run_metrics, _request_deadline(request) as deadline:
+        # The task copies the context, so every node sees the deadline
+        run = asyncio.ensure_future(
+            full_agent.ainvoke(
+                {ConfigClass.MESSAGES: [HumanMessage(content=request.message)]},
+                config=thread,
+            )
+        )
+        watcher = (
+            asyncio.create_task(_cancel_on_disconnect(http_request, run))
+            if http_request is not None
+            else None
         )
+        try:
+            response = await deadline.run(run)
+        finally:
+            if watcher is not None:
+                watcher.cancel()
 
-        print(f"Agent response keys: {response.keys()}")  # Debug log
-
-        # Check if we have a final report (research complete)
-        final_report = response.get("final_report")
-        
-        # Extract the latest AI message from the messages array
-        messages = response.get(ConfigClass.MESSAGES, [])
-        latest_ai_message = None
-        
-        # Find the last AI message in the conversation
-        for message in reversed(messages):
-            if isinstance(message, AIMessage):
-                latest_ai_message = message.content
-                break
-        
-        # Determine response text
-        if final_report:
-            # Research is complete, return the final report
-            response_text = final_report
-        elif latest_ai_message:
-            # Use the latest AI message content
-            response_text = latest_ai_message
-        else:
-            # Fallback
-            response_text = "I'm processing your request. Please wait..."
-
-        print(f"Final response text: {response_text[:100]}...")  # Debug log (first 100 chars)
-
-        if final_report:
-            # Research complete - create new thread for next conversation
-            new_thread_id = generate_session_id()
-            threads[new_thread_id] = {
-                ConfigClass.CONFIGURABLE: {
-                    ConfigClass.THREAD_ID: new_thread_id,
-                    "recursion_limit": RECURSION_LIMIT,
-                }
-            }
-            return ChatResponse(
-                thread_id=new_thread_id,
-                response=final_report,
-                report=final_report,
-                is_followup=False,
-            )
-        else:
-            # Clarification phase or intermediate step - keep using same thread
-            threads[thread_id] = thread
-            return ChatResponse(
-                thread_id=thread_id, 
-                response=response_text, 
-                is_followup=True
-            )
+    print(f"Agent response keys: {response.keys()}")  # Debug log
+
+    return await _build_chat_response(thread_id, response, run_metrics, deadline)
+
+
+research_jobs = ResearchJobManager(
+    run=_run_chat, workers=RESEARCH_WORKERS, max_queue_size=RESEARCH_QUEUE_SIZE
+)
+
+
+@app.post("/chat")
+async def chat_with_agent(request: ChatRequest, http_request: Request) -> ChatResponse:
+    """Chat Interface"""
+    try:
+        return await _run_chat(request, http_request)
+
+    except RunDeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=str(e))
 
     except Exception as e:
         print(f"Error in chat_with_agent: {str(e)}")
@@ -144,25 +326,181 @@ async def chat_with_agent(request: ChatRequest) -> ChatResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.options("/chat/stream")
+async def options_chat_stream():
+    """Handle preflight request for chat stream endpoint"""
+    return {"message": "OK"}
+
+
+def _sse(event: StreamEvent, data: Dict) -> str:
+    return f"event: {event.value}\ndata: {json.dumps(data)}\n\n"
+
+
+def _to_stream_event(event: Dict) -> Optional[str]:
+    """Map a graph event to an SSE message, or None if it is not streamed"""
+    kind = event["event"]
+    node = event.get("metadata", {}).get("langgraph_node")
+
+    if kind in ("on_chain_start", "on_chain_end"):
+        # Only the node run itself, not the runnables nested inside it
+        if event["name"] in STREAMED_NODES and event["name"] == node:
+            stream_event = (
+                StreamEvent.NODE_START
+                if kind == "on_chain_start"
+                else StreamEvent.NODE_END
+            )
+            return _sse(stream_event, {"node": node})
+
+    elif kind == "on_custom_event" and event["name"] in (
+        StreamEvent.RESEARCH_START,
+        StreamEvent.RESEARCH_END,
+    ):
+        return _sse(StreamEvent(event["name"]), event["data"])
+
+    elif kind == "on_chat_model_stream" and node == GraphNode.FINAL_REPORT_GENERATION:
+        content = event["data"]["chunk"].content
+        if content:
+            return _sse(StreamEvent.TOKEN, {"content": content})
+
+    return None
+
+
+async def _stream_agent(request: ChatRequest) -> AsyncIterator[str]:
+    thread_id, thread = _resolve_thread(
+        request.thread_id, request.research_limits, request.reuse_research
+    )
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            await thread_store.touch(thread_id)
+            # A disconnected client cancels this producer, see below
+            with (
+                track_run_metrics() as run_metrics,
+                _request_deadline(request) as deadline,
+            ):
+                async with asyncio.timeout(deadline.hard_limit()):
+                    async for event in full_agent.astream_events(
+                        {ConfigClass.MESSAGES: [HumanMessage(content=request.message)]},
+                        config=thread,
+                        version="v2",
+                    ):
+                        message = _to_stream_event(event)
+                        if message:
+                            await queue.put(message)
+
+            state = await full_agent.aget_state(thread)
+            chat_response = await _build_chat_response(
+                thread_id, state.values, run_metrics, deadline
+            )
+            await queue.put(_sse(StreamEvent.DONE, chat_response.model_dump()))
+        except TimeoutError:
+            await queue.put(
+                _sse(StreamEvent.ERROR, {"detail": "Run cancelled after its deadline"})
+            )
+        except Exception as e:
+            print(f"Error in chat_stream: {str(e)}")
+            await queue.put(_sse(StreamEvent.ERROR, {"detail": str(e)}))
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=SSE_HEARTBEAT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # SSE comment line keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                continue
+            if message is None:
+                break
+            yield message
+    finally:
+        producer.cancel()
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """Chat Interface streaming progress and report tokens as Server-Sent Events"""
+    return StreamingResponse(
+        _stream_agent(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _job_response(job: ResearchJob) -> ResearchJobResponse:
+    return ResearchJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        result=job.result,
+        error=job.error,
+        queue_position=research_jobs.queue_position(job.job_id),
+    )
+
+
+@app.post("/research", status_code=202)
+async def submit_research(request: ChatRequest) -> ResearchJobResponse:
+    """Queue a research request and return its job id immediately"""
+    try:
+        job = research_jobs.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": "30"}
+        )
+    return _job_response(job)
+
+
+@app.get("/research/{job_id}")
+async def get_research(job_id: str) -> ResearchJobResponse:
+    """Get the status and, once finished, the result of a research job"""
+    job = research_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Research job not found")
+    return _job_response(job)
+
+
+@app.post("/research/{job_id}/cancel")
+async def cancel_research(job_id: str) -> ResearchJobResponse:
+    """Cancel a queued or running research job"""
+    job = research_jobs.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Research job not found")
+    return _job_response(job)
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """LLM call, token, latency and cost metrics in Prometheus text format"""
+    return PlainTextResponse(
+        get_llm_metrics().render_prometheus(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @app.get("/threads/{thread_id}")
 async def get_thread_info(thread_id: str):
     """Get information about a specific thread"""
-    thread = threads.get(thread_id)
+    thread = await thread_store.get(thread_id)
     if not thread:
         raise HTTPException(status_code=404, detail="Thread not found")
 
+    _, config = _resolve_thread(thread_id)
     return {
         "thread_id": thread_id,
         "exists": True,
-        "config": thread.get(ConfigClass.CONFIGURABLE, {}),
+        "status": thread["status"],
+        "config": config[ConfigClass.CONFIGURABLE],
     }
 
 
 @app.delete("/threads/{thread_id}")
 async def clear_thread(thread_id: str):
     """Clear/delete a specific thread"""
-    if thread_id in threads:
-        del threads[thread_id]
+    if await thread_store.delete(thread_id, checkpointer):
         return {"message": f"Thread {thread_id} cleared successfully"}
     else:
         raise HTTPException(status_code=404, detail="Thread not found")
@@ -171,7 +509,8 @@ async def clear_thread(thread_id: str):
 @app.get("/threads")
 async def list_threads():
     """List all active threads"""
-    return {"active_threads": list(threads.keys()), "count": len(threads)}
+    active_threads = await thread_store.list(ThreadStatus.ACTIVE)
+    return {"active_threads": active_threads, "count": len(active_threads)}
 
 
 # Add a simple test endpoint to verify CORS
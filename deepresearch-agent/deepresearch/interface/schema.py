@@ -1,11 +1,29 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from deepresearch.core.constants import JobStatus
+
+
+class ResearchLimits(BaseModel):
+    """Per-request budgets of each research unit, 0 disables a limit"""
+
+    max_tool_calls: Optional[int] = Field(default=None, ge=0)
+    max_tokens: Optional[int] = Field(default=None, ge=0)
+    timeout_seconds: Optional[float] = Field(default=None, ge=0)
 
 
 class ChatRequest(BaseModel):
     thread_id: Optional[str] = None
     message: str
+    research_limits: Optional[ResearchLimits] = None  # server defaults when unset
+    # Deadline of the whole run, RUN_TIMEOUT when unset and 0 for none
+    timeout_seconds: Optional[float] = Field(default=None, ge=0)
+    # Write a report from the notes gathered so far when the deadline passes
+    partial_report: bool = True
+    # Reuse the research of a recent run of a similar brief; always stored
+    reuse_research: bool = True
 
 
 class ChatResponse(BaseModel):
@@ -13,3 +31,25 @@ class ChatResponse(BaseModel):
     response: str
     is_followup: bool = False  # indicates if model is asking for clarification
     report: Optional[str] = None
+    partial: bool = False  # research was cut short by the run deadline
+    reused_research: bool = False  # report based on an earlier run's research
+    metrics: Optional[Dict[str, Any]] = None  # LLM usage of this turn
+
+
+class ResearchJob(BaseModel):
+    job_id: str
+    status: JobStatus = JobStatus.QUEUED
+    request: ChatRequest
+    result: Optional[ChatResponse] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class ResearchJobResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    result: Optional[ChatResponse] = None
+    error: Optional[str] = None
+    queue_position: Optional[int] = None
@@ -0,0 +1,147 @@
+import logging
+import time
+from typing import List, Optional
+
+import aiosqlite
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from deepresearch.core.constants import ThreadStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ThreadStore:
+    """SQLite registry of chat threads with retention for their checkpoints.
+
+    Threads are ``active`` while the user is still talking to the agent and
+    ``finished`` once a final report was produced. ``prune`` removes expired
+    threads together with every checkpoint stored for them, keeps at most
+    ``max_finished`` finished threads (least recently used go first) and, if
+    the checkpoint database still exceeds ``max_bytes``, drops the oldest
+    threads until it fits.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        finished_ttl: float,
+        active_ttl: float,
+        max_finished: int,
+        max_bytes: int,
+    ):
+        self.conn = conn
+        self.finished_ttl = finished_ttl
+        self.active_ttl = active_ttl
+        self.max_finished = max_finished
+        self.max_bytes = max_bytes
+
+    async def setup(self) -> None:
+        await self.conn.execute("PRAGMA journal_mode=WAL")
+        await self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS threads ("
+            "thread_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        await self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS threads_status_updated_at "
+            "ON threads (status, updated_at)"
+        )
+        await self.conn.commit()
+
+    async def touch(
+        self, thread_id: str, status: ThreadStatus = ThreadStatus.ACTIVE
+    ) -> None:
+        now = time.time()
+        await self.conn.execute(
+            "INSERT INTO threads (thread_id, status, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT(thread_id) DO UPDATE SET "
+            "status = excluded.status, updated_at = excluded.updated_at",
+            (thread_id, status.value, now, now),
+        )
+        await self.conn.commit()
+
+    async def get(self, thread_id: str) -> Optional[dict]:
+        async with self.conn.execute(
+            "SELECT thread_id, status, created_at, updated_at FROM threads "
+            "WHERE thread_id = ?",
+            (thread_id,),
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip(("thread_id", "status", "created_at", "updated_at"), row))
+
+    async def list(self, status: Optional[ThreadStatus] = None) -> List[str]:
+        query = "SELECT thread_id FROM threads"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status.value,)
+        async with self.conn.execute(query + " ORDER BY updated_at", params) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def delete(self, thread_id: str, checkpointer: BaseCheckpointSaver) -> bool:
+        await checkpointer.adelete_thread(thread_id)
+        cursor = await self.conn.execute(
+            "DELETE FROM threads WHERE thread_id = ?", (thread_id,)
+        )
+        await self.conn.commit()
+        return cursor.rowcount > 0
+
+    async def prune(self, checkpointer: BaseCheckpointSaver) -> int:
+        """Apply the retention policy, returning the number of threads removed"""
+        now = time.time()
+        async with self.conn.execute(
+            "SELECT thread_id FROM threads WHERE "
+            "(status = ? AND updated_at < ?) OR (status = ? AND updated_at < ?)",
+            (
+                ThreadStatus.FINISHED.value,
+                now - self.finished_ttl,
+                ThreadStatus.ACTIVE.value,
+                now - self.active_ttl,
+            ),
+        ) as cursor:
+            stale = [row[0] for row in await cursor.fetchall()]
+
+        async with self.conn.execute(
+            "SELECT thread_id FROM threads WHERE status = ? "
+            "ORDER BY updated_at DESC LIMIT -1 OFFSET ?",
+            (ThreadStatus.FINISHED.value, self.max_finished),
+        ) as cursor:
+            stale += [row[0] for row in await cursor.fetchall()]
+
+        removed = 0
+        for thread_id in dict.fromkeys(stale):
+            await self.delete(thread_id, checkpointer)
+            removed += 1
+
+        # Least recently used finished threads; running ones are never evicted
+        while await self.size_bytes() > self.max_bytes:
+            async with self.conn.execute(
+                "SELECT thread_id FROM threads WHERE status = ? "
+                "ORDER BY updated_at LIMIT 10",
+                (ThreadStatus.FINISHED.value,),
+            ) as cursor:
+                oldest = [row[0] for row in await cursor.fetchall()]
+            if not oldest:
+                logger.warning(
+                    "Checkpoints exceed their size limit but every remaining "
+                    "thread is still active"
+                )
+                break
+            for thread_id in oldest:
+                await self.delete(thread_id, checkpointer)
+                removed += 1
+
+        if removed:
+            logger.info(f"Pruned {removed} threads and their checkpoints")
+        return removed
+
+    async def size_bytes(self) -> int:
+        """Bytes of the database in use, not counting free pages"""
+        values = []
+        for pragma in ("page_count", "freelist_count", "page_size"):
+            async with self.conn.execute(f"PRAGMA {pragma}") as cursor:
+                values.append((await cursor.fetchone())[0])
+        page_count, freelist_count, page_size = values
+        return (page_count - freelist_count) * page_size
@@ -1,54 +1,118 @@
+import asyncio
+from typing import List, Literal, Optional
 
-import os 
-import re
-from this import s
-import requests
-from typing import Optional, List
-from dotenv import load_dotenv
+import httpx
 
-load_dotenv()
+from deepresearch.config.env import (
+    PPLX_API_KEY,
+    PPLX_API_URL,
+    PPLX_MAX_CONCURRENCY,
+    PPLX_MAX_TOKENS_PER_PAGE,
+    PPLX_TIMEOUT,
+)
+from deepresearch.tools.search_cache import get_search_cache, search_cache_key
 
-from perplexity import Perplexity
+# Closest Perplexity recency filter for each search topic
+TOPIC_RECENCY = {"news": "week"}
 
-from deepresearch.config.env import PPLX_API_KEY
+# Shared async client state, rebuilt when the running loop changes
+_async_client: Optional[httpx.AsyncClient] = None
+_async_semaphore: Optional[asyncio.Semaphore] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
 
-perplexity_client = Perplexity(api_key=PPLX_API_KEY)
 
-def perplexity_search_multiple(
+def get_async_perplexity_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client for the Perplexity API"""
+    global _async_client, _async_semaphore, _async_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            base_url=PPLX_API_URL,
+            headers={"Authorization": f"Bearer {PPLX_API_KEY}"},
+            timeout=PPLX_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=PPLX_MAX_CONCURRENCY,
+                max_keepalive_connections=PPLX_MAX_CONCURRENCY,
+            ),
+        )
+        _async_semaphore = asyncio.Semaphore(PPLX_MAX_CONCURRENCY)
+        _async_loop = loop
+
+    return _async_client
+
+
+async def close_async_perplexity_client() -> None:
+    """Close the pooled Perplexity client, e.g. on application shutdown"""
+    global _async_client, _async_semaphore, _async_loop
+
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = None
+    _async_semaphore = None
+    _async_loop = None
+
+
+async def _perplexity_search_async(
+    query: str,
+    max_results: int,
+    topic: str,
+    include_raw_content: bool,
+) -> dict:
+    client = get_async_perplexity_client()
+    payload = {"query": query, "max_results": max_results}
+    if include_raw_content:
+        payload["max_tokens_per_page"] = PPLX_MAX_TOKENS_PER_PAGE
+    if topic in TOPIC_RECENCY:
+        payload["search_recency_filter"] = TOPIC_RECENCY[topic]
+
+    async with _async_semaphore:
+        response = await client.post("/search", json=payload)
+    response.raise_for_status()
+    return {"query": query, **response.json()}
+
+
+async def perplexity_search_multiple_async(
     search_queries: List[str],
     max_results: int = 3,
-    search_mode: str = "web",
-    search_recency_filter: str = "month",
-):
-    """Searches multiple queries using Perplexity AI API.
-    
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+) -> List[dict]:
+    """Perform concurrent search using the Perplexity Search API.
+
+    Mirrors ``tavily_search_multiple_async``: queries share a pooled client,
+    PPLX_MAX_CONCURRENCY caps the requests in flight, and responses are
+    served from the search cache when available.
+
     Args:
-        search_queries (List[str]): List of search queries.
-        max_retries (int, optional): Maximum number of retries. Defaults to 3.
-        search_mode (str, optional): Search mode. Defaults to "web".
-        search_recency_filter (str, optional): Search recency filter. Defaults to "month".
-    
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter, "news" restricts results to the last week
+        include_raw_content: Whether to include extracted page content
+
     Returns:
-        Tuple[str, List[str]]: Tuple containing the search results and citations.
+        List of Perplexity search responses, in the same order as the queries
     """
-    
+
     if not PPLX_API_KEY:
         raise ValueError("PPLX_API_KEY is not set")
-        
-    search_docs = []
-    
-    for query in search_queries:
-        result = perplexity_client.search.create(
-            query=query,
-            max_results=max_results,
-            search_mode=search_mode,
-            # search_recency_filter=search_recency_filter,
-        )
-        
-        search_docs.append(result)
-        
-    return search_docs
 
+    search_cache = get_search_cache()
+
+    async def search(query: str) -> dict:
+        def fetch():
+            return _perplexity_search_async(
+                query, max_results, topic, include_raw_content
+            )
+
+        if search_cache is None:
+            return await fetch()
+        return await search_cache.aget_or_fetch(
+            search_cache_key(
+                query, max_results, topic, include_raw_content, provider="perplexity"
+            ),
+            topic,
+            fetch,
+        )
 
-val = perplexity_search_multiple(search_queries=["Agentic AI"])
-print(val)
\ No newline at end of file
+    return list(await asyncio.gather(*(search(query) for query in search_queries)))
@@ -0,0 +1,293 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from deepresearch.config.env import (
+    CACHE_DIR,
+    SEARCH_CACHE_BACKEND,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_CACHE_STALE_TTL,
+    SEARCH_CACHE_STALE_WHILE_REVALIDATE,
+    SEARCH_CACHE_TTL_FINANCE,
+    SEARCH_CACHE_TTL_GENERAL,
+    SEARCH_CACHE_TTL_NEWS,
+)
+
+logger = logging.getLogger(__name__)
+
+TOPIC_TTLS = {
+    "general": SEARCH_CACHE_TTL_GENERAL,
+    "news": SEARCH_CACHE_TTL_NEWS,
+    "finance": SEARCH_CACHE_TTL_FINANCE,
+}
+
+
+def search_cache_key(
+    query: str,
+    max_results: int,
+    topic: str,
+    include_raw_content: bool,
+    provider: str = "tavily",
+) -> str:
+    """Cache key for one search request"""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "query": " ".join(query.split()).lower(),
+            "max_results": max_results,
+            "topic": topic,
+            "include_raw_content": include_raw_content,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SearchCacheBackend(ABC):
+    """Storage for cached search responses and the time they were stored"""
+
+    # Whether get/set do blocking I/O and should run off the event loop
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[dict, float]]: ...
+
+    @abstractmethod
+    def set(self, key: str, response: dict, stored_at: float) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class InMemorySearchCache(SearchCacheBackend):
+    """Process-local LRU cache"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[dict, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[dict, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, response: dict, stored_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (response, stored_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SqliteSearchCache(SearchCacheBackend):
+    """On-disk LRU cache shared by every process using the same cache dir"""
+
+    blocking = True
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[dict, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, stored_at FROM search_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE search_responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, response: dict, stored_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_responses "
+                "(key, response, stored_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(response), stored_at, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM search_responses WHERE key IN ("
+                "SELECT key FROM search_responses ORDER BY last_access DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM search_responses")
+            self._conn.commit()
+
+
+class SearchCache:
+    """Search response cache with per-topic TTLs.
+
+    With ``stale_while_revalidate`` enabled, an entry past its TTL (but within
+    ``stale_ttl`` of it) is returned immediately while a fresh response is
+    fetched in the background.
+    """
+
+    def __init__(
+        self,
+        backend: SearchCacheBackend,
+        ttls: Dict[str, float] = TOPIC_TTLS,
+        stale_while_revalidate: bool = SEARCH_CACHE_STALE_WHILE_REVALIDATE,
+        stale_ttl: float = SEARCH_CACHE_STALE_TTL,
+    ):
+        self.backend = backend
+        self.ttls = ttls
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._revalidating: set = set()
+        self._revalidating_lock = threading.Lock()
+        self._background_tasks: set = set()
+
+    def get_or_fetch(self, key: str, topic: str, fetch: Callable[[], dict]) -> dict:
+        response, revalidate = self._lookup(key, topic, self.backend.get(key))
+        if revalidate:
+            threading.Thread(
+                target=self._revalidate, args=(key, fetch), daemon=True
+            ).start()
+        if response is not None:
+            return response
+
+        response = fetch()
+        self.backend.set(key, response, time.time())
+        return response
+
+    async def aget_or_fetch(
+        self, key: str, topic: str, fetch: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        entry = await self._call_backend(self.backend.get, key)
+        response, revalidate = self._lookup(key, topic, entry)
+        if revalidate:
+            task = asyncio.create_task(self._arevalidate(key, fetch))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+        if response is not None:
+            return response
+
+        response = await fetch()
+        await self._call_backend(self.backend.set, key, response, time.time())
+        return response
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+    def _lookup(
+        self, key: str, topic: str, entry: Optional[Tuple[dict, float]]
+    ) -> Tuple[Optional[dict], bool]:
+        """Return a servable cached response and whether to start a refresh"""
+        if entry is None:
+            self.misses += 1
+            return None, False
+
+        response, stored_at = entry
+        age = time.time() - stored_at
+        ttl = self.ttls.get(topic, self.ttls["general"])
+        if age <= ttl:
+            self.hits += 1
+            return response, False
+
+        if self.stale_while_revalidate and age <= ttl + self.stale_ttl:
+            self.stale_hits += 1
+            # Only one refresh per key is kept in flight
+            with self._revalidating_lock:
+                if key in self._revalidating:
+                    return response, False
+                self._revalidating.add(key)
+            return response, True
+
+        self.misses += 1
+        return None, False
+
+    def _revalidate(self, key: str, fetch: Callable[[], dict]) -> None:
+        try:
+            self.backend.set(key, fetch(), time.time())
+        except Exception as e:
+            logger.warning(f"Failed to revalidate cached search: {e}")
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(key)
+
+    async def _arevalidate(
+        self, key: str, fetch: Callable[[], Awaitable[dict]]
+    ) -> None:
+        try:
+            response = await fetch()
+            await self._call_backend(self.backend.set, key, response, time.time())
+        except Exception as e:
+            logger.warning(f"Failed to revalidate cached search: {e}")
+        finally:
+            with self._revalidating_lock:
+                self._revalidating.discard(key)
+
+    async def _call_backend(self, method, *args):
+        if self.backend.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """Return the configured process-wide search cache, or None when disabled"""
+    global _search_cache
+
+    if SEARCH_CACHE_BACKEND == "none":
+        return None
+
+    with _search_cache_lock:
+        if _search_cache is None:
+            if SEARCH_CACHE_BACKEND == "sqlite":
+                backend = SqliteSearchCache(
+                    Path(CACHE_DIR) / "search.sqlite3", SEARCH_CACHE_MAX_ENTRIES
+                )
+            elif SEARCH_CACHE_BACKEND == "memory":
+                backend = InMemorySearchCache(SEARCH_CACHE_MAX_ENTRIES)
+            else:
+                raise ValueError(
+                    f"Invalid search cache backend: {SEARCH_CACHE_BACKEND}"
+                )
+            _search_cache = SearchCache(backend)
+    return _search_cache
@@ -0,0 +1,278 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from itertools import zip_longest
+from typing import List, Literal, Optional, Sequence
+
+from deepresearch.agents.research.sources import canonicalize_url
+from deepresearch.config.env import (
+    PPLX_API_KEY,
+    SEARCH_PROVIDERS,
+    SEARCH_RACE_PROVIDERS,
+    SEARCH_ROUTING,
+    TAVILY_API_KEY,
+)
+from deepresearch.config.metrics import count_run_event
+from deepresearch.tools.pplxapi import perplexity_search_multiple_async
+from deepresearch.tools.tavilyapi import tavily_search_multiple_async
+
+logger = logging.getLogger(__name__)
+
+Routing = Literal["fallback", "race", "merge"]
+ROUTING_POLICIES = ("fallback", "race", "merge")
+
+
+class SearchProvider(ABC):
+    """A web search API returning normalized result records.
+
+    ``search`` returns ``{"query", "provider", "results"}`` where every result
+    has ``url``, ``title``, ``content``, ``raw_content``, ``score`` and
+    ``provider``, whatever the shape of the provider's own response.
+    """
+
+    name: str
+
+    @abstractmethod
+    def available(self) -> bool:
+        """Whether the provider is configured, e.g. has an API key"""
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        max_results: int = 3,
+        topic: str = "general",
+        include_raw_content: bool = True,
+    ) -> dict: ...
+
+    def _response(self, query: str, results: List[dict]) -> dict:
+        return {"query": query, "provider": self.name, "results": results}
+
+
+class TavilyProvider(SearchProvider):
+    name = "tavily"
+
+    def available(self) -> bool:
+        return bool(TAVILY_API_KEY)
+
+    async def search(
+        self, query, max_results=3, topic="general", include_raw_content=True
+    ):
+        [response] = await tavily_search_multiple_async(
+            [query], max_results, topic, include_raw_content
+        )
+        results = [
+            {
+                "url": result["url"],
+                "title": result.get("title") or result["url"],
+                "content": result.get("content") or "",
+                "raw_content": result.get("raw_content"),
+                "score": result.get("score"),
+                "provider": self.name,
+            }
+            for result in response.get("results", [])
+        ]
+        return self._response(query, results)
+
+
+class PerplexityProvider(SearchProvider):
+    name = "perplexity"
+
+    def available(self) -> bool:
+        return bool(PPLX_API_KEY)
+
+    async def search(
+        self, query, max_results=3, topic="general", include_raw_content=True
+    ):
+        [response] = await perplexity_search_multiple_async(
+            [query], max_results, topic, include_raw_content
+        )
+        # Results come ranked without scores; with raw content requested the
+        # snippet holds the extracted page content
+        results = [
+            {
+                "url": result["url"],
+                "title": result.get("title") or result["url"],
+                "content": result.get("snippet") or "",
+                "raw_content": result.get("snippet") if include_raw_content else None,
+                "score": 1.0 / rank,
+                "provider": self.name,
+            }
+            for rank, result in enumerate(response.get("results", []), 1)
+        ]
+        return self._response(query, results)
+
+
+PROVIDERS = {
+    provider.name: provider for provider in (TavilyProvider, PerplexityProvider)
+}
+
+
+class SearchRouter:
+    """Route searches over several providers.
+
+    ``fallback`` asks the providers in order and moves on when one fails or
+    finds nothing. ``race`` asks the first ``race_width`` providers at once,
+    keeps the first useful answer and cancels the other requests, then falls
+    back to the remaining providers if none answered. ``merge`` asks every
+    provider and merges their results, deduplicated by canonical URL.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[SearchProvider],
+        routing: Routing = "fallback",
+        race_width: int = 2,
+    ):
+        if not providers:
+            raise ValueError("No search provider is configured")
+        if routing not in ROUTING_POLICIES:
+            raise ValueError(f"Unknown search routing policy: {routing}")
+        self.providers = list(providers)
+        self.routing = routing
+        self.race_width = max(1, race_width)
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 3,
+        topic: str = "general",
+        include_raw_content: bool = True,
+    ) -> dict:
+        args = (query, max_results, topic, include_raw_content)
+        if self.routing == "merge":
+            return await self._merge(self.providers, args)
+        if self.routing == "race":
+            raced = self.providers[: self.race_width]
+            response = await self._race(raced, args)
+            rest = self.providers[len(raced) :]
+            if (response is None or not response["results"]) and rest:
+                return await self._fallback(rest, args)
+            if response is None:
+                raise RuntimeError(f"Every search provider failed for: {query}")
+            return response
+        return await self._fallback(self.providers, args)
+
+    async def _fallback(self, providers: Sequence[SearchProvider], args) -> dict:
+        response, error = None, None
+        for provider in providers:
+            try:
+                response = await provider.search(*args)
+            except Exception as e:
+                error = e
+                self._failed(provider, e)
+                continue
+            if response["results"]:
+                return response
+        if response is None and error is not None:
+            raise error
+        return response or self._empty(args[0])
+
+    async def _race(self, providers: Sequence[SearchProvider], args) -> Optional[dict]:
+        """First non-empty response of the providers, None if every one failed"""
+        tasks = {
+            asyncio.create_task(provider.search(*args)): provider
+            for provider in providers
+        }
+        response = None
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    response = await next_done
+                except Exception:
+                    continue
+                if response["results"]:
+                    return response
+        finally:
+            for task, provider in tasks.items():
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.exception() is not None:
+                    self._failed(provider, task.exception())
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return response
+
+    async def _merge(self, providers: Sequence[SearchProvider], args) -> dict:
+        responses = await asyncio.gather(
+            *(provider.search(*args) for provider in providers),
+            return_exceptions=True,
+        )
+        succeeded = []
+        for provider, response in zip(providers, responses):
+            if isinstance(response, BaseException):
+                self._failed(provider, response)
+            else:
+                succeeded.append(response)
+        if not succeeded:
+            raise responses[0]
+
+        # Interleave by rank, so each provider's best results come first
+        merged = {}
+        ranked = zip_longest(*(response["results"] for response in succeeded))
+        for result in (result for rank in ranked for result in rank if result):
+            url = canonicalize_url(result["url"])
+            if url not in merged:
+                merged[url] = dict(result, providers=[result["provider"]])
+                continue
+            kept = merged[url]
+            kept["providers"].append(result["provider"])
+            if not kept.get("raw_content") and result.get("raw_content"):
+                kept["raw_content"] = result["raw_content"]
+
+        return {
+            "query": args[0],
+            "provider": "+".join(response["provider"] for response in succeeded),
+            "results": list(merged.values()),
+        }
+
+    @staticmethod
+    def _failed(provider: SearchProvider, error: BaseException) -> None:
+        logger.warning(f"Search provider {provider.name} failed: {error!r}")
+        count_run_event("search_provider_errors")
+
+    @staticmethod
+    def _empty(query: str) -> dict:
+        return {"query": query, "provider": None, "results": []}
+
+
+_search_router: Optional[SearchRouter] = None
+
+
+def get_search_router() -> SearchRouter:
+    """Return the router over the providers of SEARCH_PROVIDERS that have API keys"""
+    global _search_router
+
+    if _search_router is None:
+        names = [name.strip() for name in SEARCH_PROVIDERS.split(",") if name.strip()]
+        unknown = [name for name in names if name not in PROVIDERS]
+        if unknown:
+            raise ValueError(f"Unknown search providers: {', '.join(unknown)}")
+        providers = [PROVIDERS[name]() for name in names]
+        _search_router = SearchRouter(
+            [provider for provider in providers if provider.available()],
+            routing=SEARCH_ROUTING,
+            race_width=SEARCH_RACE_PROVIDERS,
+        )
+    return _search_router
+
+
+async def search_multiple_async(
+    search_queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+) -> List[dict]:
+    """Search every query concurrently through the configured providers.
+
+    Returns:
+        Normalized search responses, in the same order as the queries
+    """
+    router = get_search_router()
+    return list(
+        await asyncio.gather(
+            *(
+                router.search(query, max_results, topic, include_raw_content)
+                for query in search_queries
+            )
+        )
+    )
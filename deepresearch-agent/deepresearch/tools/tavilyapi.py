@@ -1,12 +1,27 @@
-from typing import List, Literal
+import asyncio
+from typing import List, Literal, Optional
 
+import httpx
 from dotenv import load_dotenv
 from tavily import TavilyClient
 
-from deepresearch.config.env import TAVILY_API_KEY
+from deepresearch.config.env import (
+    TAVILY_API_KEY,
+    TAVILY_API_URL,
+    TAVILY_MAX_CONCURRENCY,
+    TAVILY_TIMEOUT,
+)
+from deepresearch.tools.search_cache import get_search_cache, search_cache_key
 
 load_dotenv()
-tavily_client = TavilyClient()
+_tavily_client: Optional[TavilyClient] = None
+
+# Shared async client state. httpx connection pools and asyncio semaphores are
+# bound to the event loop that first uses them, so both are rebuilt whenever
+# the running loop changes (e.g. separate ``asyncio.run`` calls).
+_async_client: Optional[httpx.AsyncClient] = None
+_async_semaphore: Optional[asyncio.Semaphore] = None
+_async_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
 def tavily_search_multiple(
@@ -27,18 +42,150 @@ def tavily_search_multiple(
         List of search result dictionaries
     """
 
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
+    # Execute searches sequentially. Use tavily_search_multiple_async to run them concurrently.
     if not TAVILY_API_KEY:
         raise ValueError("Tavily API Key is Missing!")
 
+    tavily_client = get_tavily_client()
+    search_cache = get_search_cache()
     search_docs = []
     for query in search_queries:
-        result = tavily_client.search(
-            query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-            topic=topic,
-        )
+
+        def search(query=query):
+            return tavily_client.search(
+                query,
+                max_results=max_results,
+                include_raw_content=include_raw_content,
+                topic=topic,
+            )
+
+        if search_cache is None:
+            result = search()
+        else:
+            result = search_cache.get_or_fetch(
+                search_cache_key(query, max_results, topic, include_raw_content),
+                topic,
+                search,
+            )
         search_docs.append(result)
 
     return search_docs
+
+
+def get_tavily_client() -> TavilyClient:
+    """Return the shared synchronous Tavily client, creating it on first use"""
+    global _tavily_client
+
+    if _tavily_client is None:
+        _tavily_client = TavilyClient(api_key=TAVILY_API_KEY)
+    return _tavily_client
+
+
+def get_async_tavily_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client for the Tavily API"""
+    global _async_client, _async_semaphore, _async_loop
+
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            base_url=TAVILY_API_URL,
+            headers={"Authorization": f"Bearer {TAVILY_API_KEY}"},
+            timeout=TAVILY_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=TAVILY_MAX_CONCURRENCY,
+                max_keepalive_connections=TAVILY_MAX_CONCURRENCY,
+            ),
+        )
+        _async_semaphore = asyncio.Semaphore(TAVILY_MAX_CONCURRENCY)
+        _async_loop = loop
+
+    return _async_client
+
+
+async def close_async_tavily_client() -> None:
+    """Close the pooled Tavily client, e.g. on application shutdown"""
+    global _async_client, _async_semaphore, _async_loop
+
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = None
+    _async_semaphore = None
+    _async_loop = None
+
+
+async def _tavily_search_async(
+    query: str,
+    max_results: int,
+    topic: str,
+    include_raw_content: bool,
+) -> dict:
+    client = get_async_tavily_client()
+    async with _async_semaphore:
+        response = await client.post(
+            "/search",
+            json={
+                "query": query,
+                "max_results": max_results,
+                "topic": topic,
+                "include_raw_content": include_raw_content,
+            },
+        )
+    response.raise_for_status()
+    return response.json()
+
+
+async def _cached_tavily_search_async(
+    query: str,
+    max_results: int,
+    topic: str,
+    include_raw_content: bool,
+) -> dict:
+    def search():
+        return _tavily_search_async(query, max_results, topic, include_raw_content)
+
+    search_cache = get_search_cache()
+    if search_cache is None:
+        return await search()
+
+    return await search_cache.aget_or_fetch(
+        search_cache_key(query, max_results, topic, include_raw_content),
+        topic,
+        search,
+    )
+
+
+async def tavily_search_multiple_async(
+    search_queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+) -> List[dict]:
+    """Perform concurrent search using Tavily API for multiple queries.
+
+    All queries are issued at once over a shared connection pool; the number of
+    requests in flight across the process is capped by TAVILY_MAX_CONCURRENCY.
+    Responses are served from the search cache when available.
+
+    Args:
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+
+    Returns:
+        List of search result dictionaries, in the same order as the queries
+    """
+
+    if not TAVILY_API_KEY:
+        raise ValueError("Tavily API Key is Missing!")
+
+    return list(
+        await asyncio.gather(
+            *(
+                _cached_tavily_search_async(
+                    query, max_results, topic, include_raw_content
+                )
+                for query in search_queries
+            )
+        )
+    )
@@ -1,15 +1,22 @@
 from typing import Annotated, Literal
 
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import InjectedToolArg, tool
 from pydantic import BaseModel, Field
 
 from deepresearch.agents.research.methods import (
+    aprocess_search_results,
     deduplicate_search_results,
     format_search_output,
     process_search_results,
 )
+from deepresearch.agents.research.sources import get_source_registry
+from deepresearch.core.constants import ConfigClass
+from deepresearch.tools.search_providers import (
+    PerplexityProvider,
+    search_multiple_async,
+)
 from deepresearch.tools.tavilyapi import tavily_search_multiple
-from deepresearch.tools.pplxapi import perplexity_client, perplexity_search_multiple
 
 
 @tool(parse_docstring=True)
@@ -36,7 +43,42 @@ def tavily_search(
     )
 
     uniques_results = deduplicate_search_results(search_results)
-    summarized_results = process_search_results(uniques_results)
+    summarized_results = process_search_results(uniques_results, query=query)
+
+    return format_search_output(summarized_results)
+
+
+@tool("tavily_search", parse_docstring=True)
+async def async_tavily_search(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[
+        Literal["general", "news", "finance"], InjectedToolArg
+    ] = "general",
+    config: RunnableConfig = None,
+) -> str:
+    """Fetch results from the configured web search providers with content summarization.
+
+    Args:
+        query: A single search query to execute
+        max_results: Maximum number of results to return
+        topic: Topic to filter results by ('general', 'news', 'finance')
+
+    Returns:
+        Formatted string of search results with summaries
+    """
+
+    # Pages are summarized once per conversation thread, across all researchers
+    run_id = (config or {}).get(ConfigClass.CONFIGURABLE, {}).get(ConfigClass.THREAD_ID)
+
+    search_results = await search_multiple_async(
+        [query], max_results=max_results, topic=topic, include_raw_content=True
+    )
+
+    uniques_results = deduplicate_search_results(search_results)
+    summarized_results = await aprocess_search_results(
+        uniques_results, query=query, registry=get_source_registry(run_id)
+    )
 
     return format_search_output(summarized_results)
 
@@ -85,33 +127,35 @@ class ResearchComplete(BaseModel):
     pass
 
 
-@tool
-def perplexity_search(
+@tool(parse_docstring=True)
+async def perplexity_search(
     query: str,
     max_results: Annotated[int, InjectedToolArg] = 3,
-    search_mode: Annotated[
-        Literal["web", "academic"], InjectedToolArg
-    ] = "web",
-    search_recency_filter: Annotated[
-        Literal["day", "month"], InjectedToolArg
-    ] = "month",
-):
-    """Searches the web content based on a given query and Fetch results. 
-    from Perplexity Search API with Content Summarization
-    
+    topic: Annotated[
+        Literal["general", "news", "finance"], InjectedToolArg
+    ] = "general",
+    config: RunnableConfig = None,
+) -> str:
+    """Fetch results from Perplexity Search API with content summarization.
+
     Args:
-        query (str): The search query.
-        max_results (int): Maximum number of results to fetch.
-        search_mode (str): Search mode ('web' or 'academic').
-        search_recency_filter (str): Recency filter ('day' or 'month').
+        query: A single search query to execute
+        max_results: Maximum number of results to return
+        topic: Topic to filter results by ('general', 'news', 'finance')
 
     Returns:
-        List of search results.
+        Formatted string of search results with summaries
     """
-    
-    search_results = perplexity_search_multiple(
-        [query], max_results, search_mode, search_recency_filter
+
+    run_id = (config or {}).get(ConfigClass.CONFIGURABLE, {}).get(ConfigClass.THREAD_ID)
+
+    search_results = await PerplexityProvider().search(
+        query, max_results=max_results, topic=topic, include_raw_content=True
+    )
+
+    uniques_results = deduplicate_search_results([search_results])
+    summarized_results = await aprocess_search_results(
+        uniques_results, query=query, registry=get_source_registry(run_id)
     )
-    
-    unique_results = ""
-    return search_results
+
+    return format_search_output(summarized_results)